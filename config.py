@@ -96,6 +96,7 @@ class Config:
     SQLALCHEMY_ENGINE_OPTIONS = {
         "max_overflow": 100,  # how many spare connections we can use?
         "pool_size": 5,  # how many queries will run symultaniously?
+        "executemany_mode": "values_plus_batch",  # batch bulk inserts/updates
     }
 
     SCHEDULER_HOST = "http://127.0.0.1:5001/api"
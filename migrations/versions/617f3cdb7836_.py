@@ -0,0 +1,56 @@
+"""empty message
+
+Revision ID: 617f3cdb7836
+Revises: f70dae6832cb
+Create Date: 2026-10-15 23:57:31.413248
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '617f3cdb7836'
+down_revision = 'f70dae6832cb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('login', schema=None) as batch_op:
+        batch_op.alter_column('login_date',
+               existing_type=postgresql.TIMESTAMP(),
+               server_default=None,
+               existing_nullable=False)
+
+    with op.batch_alter_table('project', schema=None) as batch_op:
+        batch_op.alter_column('created',
+               existing_type=postgresql.TIMESTAMP(),
+               server_default=None,
+               existing_nullable=False)
+
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.alter_column('created',
+               existing_type=postgresql.TIMESTAMP(),
+               server_default=None,
+               existing_nullable=False)
+
+
+def downgrade():
+    with op.batch_alter_table('login', schema=None) as batch_op:
+        batch_op.alter_column('login_date',
+               existing_type=postgresql.TIMESTAMP(),
+               server_default=sa.text('now()'),
+               existing_nullable=False)
+
+    with op.batch_alter_table('project', schema=None) as batch_op:
+        batch_op.alter_column('created',
+               existing_type=postgresql.TIMESTAMP(),
+               server_default=sa.text('now()'),
+               existing_nullable=False)
+
+    with op.batch_alter_table('task', schema=None) as batch_op:
+        batch_op.alter_column('created',
+               existing_type=postgresql.TIMESTAMP(),
+               server_default=sa.text('now()'),
+               existing_nullable=False)
@@ -14,13 +14,13 @@ scripts after running :obj:`scheduler.create_app`
 """
 
 import datetime
+from typing import Any, Optional
 
 from flask_executor import Executor
 from flask_redis import FlaskRedis
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import String
+from sqlalchemy import Boolean, Dialect, String, TypeDecorator
 from sqlalchemy.orm import DeclarativeBase, mapped_column, registry
-from sqlalchemy.sql import functions
 from typing_extensions import Annotated
 
 str_5 = Annotated[str, 5]
@@ -35,10 +35,21 @@ str_8000 = Annotated[str, 8000]
 intpk = Annotated[int, mapped_column(primary_key=True, index=True)]
 timestamp = Annotated[
     datetime.datetime,
-    mapped_column(nullable=False, server_default=functions.now()),
+    mapped_column(nullable=False, default=datetime.datetime.now),
 ]
 
 
+class Flag(TypeDecorator):
+    """Boolean column that also accepts the 1/0 values sent by forms."""
+
+    impl = Boolean
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[Any], dialect: Dialect) -> Optional[bool]:
+        """Convert 1/0 to True/False."""
+        return None if value is None else bool(value)
+
+
 class Base(DeclarativeBase):
     """Declare base types."""
 
@@ -52,6 +63,7 @@ class Base(DeclarativeBase):
             str_5: String(5),
             str_30: String(30),
             str_400: String(400),
+            bool: Flag(),
         }
     )
 
@@ -128,14 +128,11 @@ class RunnerException(Exception):
         # if the error is coming from a run, we may need to trigger a retry.
         if run_id:
             # increment attempt counter
-            redis_client.zincrby(f"runner_{task.id}_attempt", 1, "inc")
+            run_number = int(redis_client.zincrby(f"runner_{task.id}_attempt", 1, "inc") or 1)
             task.status_id = 2
 
             # if task ended with a non-catastrophic error, it is possible that we can rerun it.
-            if (redis_client.zincrby(f"runner_{task.id}_attempt", 0, "inc") or 1) <= (
-                task.max_retries or 0
-            ):
-                run_number = int(redis_client.zincrby(f"runner_{task.id}_attempt", 0, "inc") or 1)
+            if run_number <= (task.max_retries or 0):
 
                 # schedule a rerun in 5 minutes.
                 RunnerLog(
@@ -157,7 +154,7 @@ class RunnerException(Exception):
                 if task.project.sequence_tasks == 1:
                     task_id_list = [
                         x.id
-                        for x in Task.query.filter_by(enabled=1)
+                        for x in Task.query.filter_by(enabled=True)
                         .filter_by(project_id=task.project_id)
                         .order_by(Task.order.asc(), Task.name.asc())  # type: ignore[union-attr]
                         .all()
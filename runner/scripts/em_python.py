@@ -299,6 +299,9 @@ class PyProcesser:
                 connection = em_ssh.connection_json(self.task.source_ssh_conn)
 
             def clean_string(text: Optional[Union[str, int, datetime.datetime]]) -> str:
+                # flags are booleans in the db, but scripts have always received 1/0.
+                if isinstance(text, bool):
+                    text = int(text)
                 return str(text).replace("'", "").replace('"', "")
 
             project_data = {
@@ -337,7 +340,7 @@ class PyProcesser:
                 "name": clean_string(self.task.name),
                 "project_id": clean_string(self.task.project_id),
                 "status_id": clean_string(self.task.status_id),
-                "status": clean_string(self.task.status.name),
+                "status": clean_string(self.task.status_name),
                 "enabled": clean_string(self.task.enabled),
                 "order": clean_string(self.task.order),
                 "last_run": clean_string(self.task.last_run),
@@ -177,7 +177,7 @@ class Runner:
             task_list = (
                 db.session.execute(
                     db.select(Task)
-                    .filter_by(enabled=1, project_id=task.project_id)
+                    .filter_by(enabled=True, project_id=task.project_id)
                     .where(Task.order > task.order)
                     .order_by(Task.order.asc())
                 )
@@ -188,7 +188,7 @@ class Runner:
             # check if any are still running in same order.
             runners = db.session.execute(
                 db.select(Task)
-                .filter_by(enabled=1, order=task.order, project_id=task.project_id)
+                .filter_by(enabled=True, order=task.order, project_id=task.project_id)
                 # 4 is completed. This also filters out error tasks
                 .where(Task.status_id != 4)
                 .where(Task.id != task.id)
@@ -200,7 +200,7 @@ class Runner:
             # also make sure everything is completed before
             # going on to starting next tasks.
             if (
-                db.session.execute(db.select(Task).filter_by(enabled=1, id=task.id)).scalar()
+                db.session.execute(db.select(Task).filter_by(enabled=True, id=task.id)).scalar()
                 and not runners
                 and task_list
             ):
@@ -22,7 +22,7 @@ from dateutil.tz import tzlocal
 from runner import model
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def client_fixture() -> Generator:
     app = runner_create_app()
     with app.test_client() as client, app.app_context():
@@ -56,7 +56,7 @@ def job_missed(event: JobEvent) -> None:
 
             ex_time = datetime.datetime.now(datetime.timezone.utc) - event.scheduled_run_time
 
-            if Task.query.filter_by(id=task_id).first():
+            if db.session.execute(db.select(Task.id).filter_by(id=task_id)).first():
                 log = TaskLog(
                     task_id=task_id,
                     status_id=6,
@@ -113,7 +113,9 @@ def job_executed(event: JobExecutionEvent) -> None:
         if re.match(r"^\d+-\d+-.+?$", event.job_id):
             _, task_id = event.job_id.split("-")[:2]
 
-            task = Task.query.filter_by(id=task_id).first()
+            task = db.session.execute(
+                db.select(Task.last_run_job_id).filter_by(id=task_id)
+            ).first()
 
             # only log valid tasks
             if task:
@@ -181,9 +183,7 @@ def job_removed(event: JobEvent) -> None:
         if re.match(r"^\d+-\d+-.+?$", event.job_id):
             _, task_id = event.job_id.split("-")[:2]
 
-            task = Task.query.filter_by(id=task_id).first()
-
-            if task:
+            if db.session.execute(db.select(Task.id).filter_by(id=task_id)).first():
                 log = TaskLog(
                     task_id=task_id,
                     status_id=6,
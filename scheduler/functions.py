@@ -114,7 +114,7 @@ def scheduler_add_task(task_id: int) -> bool:
     if not task:
         return False
 
-    task.enabled = 1
+    task.enabled = True
     db.session.commit()
 
     my_hash = hashlib.sha256()
@@ -29,7 +29,7 @@ def job_sync() -> None:
                 update(Task)
                 .where(
                     and_(
-                        Task.enabled == 0,
+                        Task.enabled.is_(False),
                         or_(Task.next_run != None, Task.est_duration != None),  # noqa: E711
                     )
                 )
@@ -38,12 +38,16 @@ def job_sync() -> None:
             db.session.commit()
 
             # remove disabled jobs from the scheduler
-            scheduler_jobs = atlas_scheduler.get_jobs()
-
-            for task in Task.query.filter_by(enabled=0).all():
-                for job in scheduler_jobs:
-                    if job.args and str(job.args[0]) == str(task.id):
-                        job.remove()
+            disabled_ids = {
+                str(task_id)
+                for task_id in db.session.execute(
+                    db.select(Task.id).filter(Task.enabled.is_(False))
+                ).scalars()
+            }
+
+            for job in atlas_scheduler.get_jobs():
+                if job.args and str(job.args[0]) in disabled_ids:
+                    job.remove()
 
     # pylint: disable=broad-except
     except BaseException as e:
@@ -21,10 +21,19 @@ migrations file - so flask-migrations think it has already applied the migration
 """
 
 import datetime
-from typing import List, Optional
-
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.sql import functions
+import functools
+from typing import Dict, List, Optional, Type
+
+from sqlalchemy import event
+from sqlalchemy.orm import (
+    Mapped,
+    declared_attr,
+    joinedload,
+    lazyload,
+    mapped_column,
+    raiseload,
+    relationship,
+)
 
 from .extensions import (
     db,
@@ -42,14 +51,27 @@ from .extensions import (
 )
 
 
+@functools.lru_cache(maxsize=None)
+def _lookup_names(model: Type[db.Model]) -> Dict[int, str]:
+    """Get an {id: name} map of a lookup table, cached for the process."""
+    return dict(db.session.execute(db.select(model.id, model.name)).tuples().all())
+
+
+def _lookup(model: Type[db.Model], lookup_id: Optional[int]) -> Optional[str]:
+    """Get the name of a lookup table row without a query."""
+    if lookup_id is None:
+        return None
+    return _lookup_names(model).get(lookup_id)
+
+
 class LoginType(db.Model):
     """Lookup table of user login types."""
 
     __tablename__ = "login_type"
 
     id: Mapped[intpk]
-    name: Mapped[Optional[str_120]]
-    login: Mapped[List["Login"]] = relationship(back_populates="login_type", lazy=True)
+    name: Mapped[Optional[str_120]] = mapped_column(index=True)
+    login: Mapped[List["Login"]] = relationship(back_populates="login_type", lazy="raise")
 
 
 class Login(db.Model):
@@ -61,7 +83,7 @@ class Login(db.Model):
     type_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(LoginType.id))
     username: Mapped[Optional[str_120]]
     login_date: Mapped[Optional[timestamp]]
-    login_type: Mapped["LoginType"] = relationship(back_populates="login")
+    login_type: Mapped["LoginType"] = relationship(back_populates="login", lazy="select")
 
 
 class User(db.Model):
@@ -75,46 +97,79 @@ class User(db.Model):
     full_name: Mapped[Optional[str_200]]
     first_name: Mapped[Optional[str_200]]
     project_owner: Mapped["Project"] = relationship(
-        backref="project_owner", lazy=True, foreign_keys="Project.owner_id"
+        back_populates="project_owner", lazy="raise", foreign_keys="Project.owner_id"
     )
     project_creator: Mapped["Project"] = relationship(
-        backref="project_creator",
-        lazy=True,
+        back_populates="project_creator",
+        lazy="raise",
         foreign_keys="Project.creator_id",
     )
     project_updater: Mapped["Project"] = relationship(
-        backref="project_updater",
-        lazy=True,
+        back_populates="project_updater",
+        lazy="raise",
         foreign_keys="Project.updater_id",
     )
     task_creator: Mapped["Task"] = relationship(
-        backref="task_creator", lazy=True, foreign_keys="Task.creator_id"
+        back_populates="task_creator", lazy="raise", foreign_keys="Task.creator_id"
     )
     task_updater: Mapped["Task"] = relationship(
-        backref="task_updater", lazy=True, foreign_keys="Task.updater_id"
+        back_populates="task_updater", lazy="raise", foreign_keys="Task.updater_id"
     )
     is_authenticated = True
     is_active = True
     is_anonymous = False
 
     def get_id(self) -> str:
-        """Convert id to unicode."""
-        return str(self.id).encode("utf-8").decode("utf-8")
+        """Get id as a string for flask-login."""
+        return str(self.id)
 
     def __str__(self) -> str:
         """Return default string."""
         return self.full_name or f"User {self.id}"
 
 
-class Project(db.Model):
+class TimestampedMixin:
+    """Created/updated audit columns shared by projects and tasks."""
+
+    created: Mapped[Optional[timestamp]] = mapped_column(index=True)
+    updated: Mapped[Optional[datetime.datetime]] = mapped_column(
+        onupdate=datetime.datetime.now, index=True
+    )
+
+    @declared_attr
+    def creator_id(cls) -> Mapped[Optional[int]]:
+        """User who created the record."""
+        return mapped_column(
+            db.ForeignKey(User.id, ondelete="SET NULL", deferrable=True, initially="DEFERRED"),
+            index=True,
+        )
+
+    @declared_attr
+    def updater_id(cls) -> Mapped[Optional[int]]:
+        """User who last updated the record."""
+        return mapped_column(
+            db.ForeignKey(User.id, ondelete="SET NULL", deferrable=True, initially="DEFERRED"),
+            index=True,
+        )
+
+
+class Project(TimestampedMixin, db.Model):
     """Table containing project details."""
 
     # pylint: disable=too-many-instance-attributes
 
     id: Mapped[intpk]
     name: Mapped[Optional[str_120]]
-    description: Mapped[Optional[str_8000]]
-    owner_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(User.id), index=True)
+    description: Mapped[Optional[str]] = mapped_column(
+        db.Text, nullable=True, deferred=True, deferred_group="project_bodies"
+    )
+    owner_id: Mapped[Optional[int]] = mapped_column(
+        db.ForeignKey(User.id, ondelete="SET NULL", deferrable=True, initially="DEFERRED"),
+        index=True,
+    )
+    project_owner: Mapped[Optional["User"]] = relationship(
+        back_populates="project_owner", lazy="joined", foreign_keys=[owner_id]
+    )
 
     cron: Mapped[Optional[int]]
     cron_year: Mapped[Optional[str_120]]
@@ -136,28 +191,33 @@ class Project(db.Model):
     ooff: Mapped[Optional[int]]
     ooff_date: Mapped[Optional[datetime.datetime]]
 
-    global_params: Mapped[Optional[str_8000]]
-    sequence_tasks: Mapped[Optional[int]]
+    global_params: Mapped[Optional[str]] = mapped_column(
+        db.Text, nullable=True, deferred=True, deferred_group="project_bodies"
+    )
+    sequence_tasks: Mapped[Optional[bool]]
 
     task: Mapped[List["Task"]] = relationship(
-        backref="project",
-        lazy="dynamic",
+        back_populates="project",
+        lazy="select",
+        order_by="Task.order",
         cascade="all, delete, delete-orphan",
         passive_deletes=True,
     )
 
     # projectparams link
     params: Mapped[List["ProjectParam"]] = relationship(
-        backref="project",
-        lazy=True,
+        back_populates="project",
+        lazy="select",
         cascade="all, delete, delete-orphan",
         passive_deletes=True,
     )
 
-    created: Mapped[Optional[timestamp]]
-    creator_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(User.id), index=True)
-    updated: Mapped[Optional[datetime.datetime]] = mapped_column(onupdate=functions.now())
-    updater_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(User.id), index=True)
+    project_creator: Mapped[Optional["User"]] = relationship(
+        back_populates="project_creator", lazy="select", foreign_keys="Project.creator_id"
+    )
+    project_updater: Mapped[Optional["User"]] = relationship(
+        back_populates="project_updater", lazy="select", foreign_keys="Project.updater_id"
+    )
 
     def __str__(self) -> str:
         """Return default string."""
@@ -170,8 +230,8 @@ class TaskSourceType(db.Model):
     __tablename__ = "task_source_type"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    name: Mapped[Optional[str_120]]
-    task: Mapped["Task"] = relationship(backref="source_type", lazy=True)
+    name: Mapped[Optional[str_120]] = mapped_column(index=True)
+    task: Mapped["Task"] = relationship(back_populates="source_type", lazy="raise")
 
 
 class TaskSourceQueryType(db.Model):
@@ -180,8 +240,8 @@ class TaskSourceQueryType(db.Model):
     __tablename__ = "task_source_query_type"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    name: Mapped[Optional[str_120]]
-    task: Mapped["Task"] = relationship(backref="query_type", lazy=True)
+    name: Mapped[Optional[str_120]] = mapped_column(index=True)
+    task: Mapped["Task"] = relationship(back_populates="query_type", lazy="raise")
 
 
 class TaskProcessingType(db.Model):
@@ -190,8 +250,8 @@ class TaskProcessingType(db.Model):
     __tablename__ = "task_processing_type"
 
     id: Mapped[intpk]
-    name: Mapped[Optional[str_120]]
-    task: Mapped["Task"] = relationship(backref="processing_type", lazy=True)
+    name: Mapped[Optional[str_120]] = mapped_column(index=True)
+    task: Mapped["Task"] = relationship(back_populates="processing_type", lazy="raise")
 
 
 class TaskStatus(db.Model):
@@ -203,16 +263,16 @@ class TaskStatus(db.Model):
     __tablename__ = "task_status"
 
     id: Mapped[intpk]
-    name: Mapped[Optional[str_1000]]
+    name: Mapped[Optional[str_1000]] = mapped_column(index=True)
     task: Mapped[List["Task"]] = relationship(
-        backref="status",
-        lazy="dynamic",
+        back_populates="status",
+        lazy="raise",
         cascade="all, delete, delete-orphan",
         passive_deletes=True,
     )
     task_log: Mapped[List["TaskLog"]] = relationship(
-        backref="status",
-        lazy="dynamic",
+        back_populates="status",
+        lazy="raise",
         cascade="all, delete, delete-orphan",
         passive_deletes=True,
     )
@@ -232,33 +292,39 @@ class Connection(db.Model):
     primary_contact: Mapped[Optional[str_400]]
     primary_contact_email: Mapped[Optional[str_120]]
     primary_contact_phone: Mapped[Optional[str_120]]
+
+    # keep these collections on selectin. joining several one-to-many collections
+    # in one query returns the cartesian product of them - two sftp rows and six
+    # smb rows come back as twelve rows per connection. the reverse task links on
+    # the child tables stay on "raise"; loading every task for a connection is
+    # never wanted implicitly.
     ssh: Mapped[List["ConnectionSsh"]] = relationship(
-        backref="connection",
-        lazy=True,
+        back_populates="connection",
+        lazy="selectin",
         foreign_keys="ConnectionSsh.connection_id",
     )
     sftp: Mapped[List["ConnectionSftp"]] = relationship(
-        backref="connection",
-        lazy=True,
+        back_populates="connection",
+        lazy="selectin",
         foreign_keys="ConnectionSftp.connection_id",
     )
     ftp: Mapped[List["ConnectionFtp"]] = relationship(
-        backref="connection",
-        lazy=True,
+        back_populates="connection",
+        lazy="selectin",
         foreign_keys="ConnectionFtp.connection_id",
     )
     smb: Mapped[List["ConnectionSmb"]] = relationship(
-        backref="connection",
-        lazy=True,
+        back_populates="connection",
+        lazy="selectin",
         foreign_keys="ConnectionSmb.connection_id",
     )
     database: Mapped[List["ConnectionDatabase"]] = relationship(
         back_populates="connection",
-        lazy=True,
+        lazy="selectin",
     )
     gpg: Mapped[List["ConnectionGpg"]] = relationship(
-        backref="connection",
-        lazy=True,
+        back_populates="connection",
+        lazy="selectin",
         foreign_keys="ConnectionGpg.connection_id",
     )
 
@@ -275,34 +341,43 @@ class ConnectionSftp(db.Model):
     __tablename__ = "connection_sftp"
 
     id: Mapped[intpk]
-    connection_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(Connection.id), index=True)
+    connection_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(Connection.id))
+    connection: Mapped[Optional["Connection"]] = relationship(
+        back_populates="sftp", lazy="select", foreign_keys=[connection_id]
+    )
     name: Mapped[Optional[str_500]]
     address: Mapped[Optional[str_500]]
     port: Mapped[Optional[int]]
     path: Mapped[Optional[str_500]]
     username: Mapped[Optional[str_120]]
-    key: Mapped[Optional[str_8000]]
+    key: Mapped[Optional[str]] = mapped_column(db.Text, nullable=True, deferred=True)
     password: Mapped[Optional[str]] = mapped_column(db.Text, nullable=True)
     key_password: Mapped[Optional[str]] = mapped_column(db.Text, nullable=True)
     task: Mapped["Task"] = relationship(
-        backref="destination_sftp_conn",
-        lazy=True,
+        back_populates="destination_sftp_conn",
+        lazy="raise",
         foreign_keys="Task.destination_sftp_id",
     )
     task_source: Mapped["Task"] = relationship(
-        backref="source_sftp_conn",
-        lazy=True,
+        back_populates="source_sftp_conn",
+        lazy="raise",
         foreign_keys="Task.source_sftp_id",
     )
     query_source: Mapped["Task"] = relationship(
-        backref="query_sftp_conn", lazy=True, foreign_keys="Task.query_sftp_id"
+        back_populates="query_sftp_conn",
+        lazy="raise",
+        foreign_keys="Task.query_sftp_id",
     )
     processing_source: Mapped["Task"] = relationship(
-        backref="processing_sftp_conn",
-        lazy=True,
+        back_populates="processing_sftp_conn",
+        lazy="raise",
         foreign_keys="Task.processing_sftp_id",
     )
 
+    # task pickers list a connection's rows by name. the index also serves the
+    # plain connection_id lookups, so it replaces the single column index.
+    __table_args__ = (db.Index("ix_connection_sftp_connection_id_name", "connection_id", "name"),)
+
     def __str__(self) -> str:
         """Get string of name."""
         return str(self.name)
@@ -316,18 +391,23 @@ class ConnectionSsh(db.Model):
     __tablename__ = "connection_ssh"
 
     id: Mapped[intpk]
-    connection_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(Connection.id), index=True)
+    connection_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(Connection.id))
+    connection: Mapped[Optional["Connection"]] = relationship(
+        back_populates="ssh", lazy="select", foreign_keys=[connection_id]
+    )
     name: Mapped[Optional[str_500]]
     address: Mapped[Optional[str_500]]
     port: Mapped[Optional[int]]
     username: Mapped[Optional[str_120]]
     password: Mapped[Optional[str]] = mapped_column(db.Text, nullable=True)
     task_source: Mapped["Task"] = relationship(
-        backref="source_ssh_conn",
-        lazy=True,
+        back_populates="source_ssh_conn",
+        lazy="raise",
         foreign_keys="Task.source_ssh_id",
     )
 
+    __table_args__ = (db.Index("ix_connection_ssh_connection_id_name", "connection_id", "name"),)
+
     def __str__(self) -> str:
         """Get string of name."""
         return str(self.name)
@@ -341,15 +421,20 @@ class ConnectionGpg(db.Model):
     __tablename__ = "connection_gpg"
 
     id: Mapped[intpk]
-    connection_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(Connection.id), index=True)
+    connection_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(Connection.id))
+    connection: Mapped[Optional["Connection"]] = relationship(
+        back_populates="gpg", lazy="select", foreign_keys=[connection_id]
+    )
     name: Mapped[Optional[str_500]]
-    key: Mapped[Optional[str_8000]]
+    key: Mapped[Optional[str]] = mapped_column(db.Text, nullable=True, deferred=True)
     task_source: Mapped["Task"] = relationship(
-        backref="file_gpg_conn",
-        lazy=True,
+        back_populates="file_gpg_conn",
+        lazy="raise",
         foreign_keys="Task.file_gpg_id",
     )
 
+    __table_args__ = (db.Index("ix_connection_gpg_connection_id_name", "connection_id", "name"),)
+
     def __str__(self) -> str:
         """Get string of name."""
         return str(self.name)
@@ -363,29 +448,38 @@ class ConnectionFtp(db.Model):
     __tablename__ = "connection_ftp"
 
     id: Mapped[intpk]
-    connection_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(Connection.id), index=True)
+    connection_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(Connection.id))
+    connection: Mapped[Optional["Connection"]] = relationship(
+        back_populates="ftp", lazy="select", foreign_keys=[connection_id]
+    )
     name: Mapped[Optional[str_500]]
     address: Mapped[Optional[str_500]]
     path: Mapped[Optional[str_500]]
     username: Mapped[Optional[str_500]]
     password: Mapped[Optional[str]] = mapped_column(db.Text, nullable=True)
     task: Mapped["Task"] = relationship(
-        backref="destination_ftp_conn",
-        lazy=True,
+        back_populates="destination_ftp_conn",
+        lazy="raise",
         foreign_keys="Task.destination_ftp_id",
     )
     task_source: Mapped["Task"] = relationship(
-        backref="source_ftp_conn", lazy=True, foreign_keys="Task.source_ftp_id"
+        back_populates="source_ftp_conn",
+        lazy="raise",
+        foreign_keys="Task.source_ftp_id",
     )
     query_source: Mapped["Task"] = relationship(
-        backref="query_ftp_conn", lazy=True, foreign_keys="Task.query_ftp_id"
+        back_populates="query_ftp_conn",
+        lazy="raise",
+        foreign_keys="Task.query_ftp_id",
     )
     processing_source: Mapped["Task"] = relationship(
-        backref="processing_ftp_conn",
-        lazy=True,
+        back_populates="processing_ftp_conn",
+        lazy="raise",
         foreign_keys="Task.processing_ftp_id",
     )
 
+    __table_args__ = (db.Index("ix_connection_ftp_connection_id_name", "connection_id", "name"),)
+
     def __str__(self) -> str:
         """Get string of name."""
         return str(self.name)
@@ -399,7 +493,10 @@ class ConnectionSmb(db.Model):
     __tablename__ = "connection_smb"
 
     id: Mapped[intpk]
-    connection_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(Connection.id), index=True)
+    connection_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(Connection.id))
+    connection: Mapped[Optional["Connection"]] = relationship(
+        back_populates="smb", lazy="select", foreign_keys=[connection_id]
+    )
     name: Mapped[Optional[str_120]]
     share_name: Mapped[Optional[str_500]]
     path: Mapped[Optional[str_1000]]
@@ -408,22 +505,28 @@ class ConnectionSmb(db.Model):
     server_ip: Mapped[Optional[str_500]]
     server_name: Mapped[Optional[str_500]]
     task: Mapped["Task"] = relationship(
-        backref="destination_smb_conn",
-        lazy=True,
+        back_populates="destination_smb_conn",
+        lazy="raise",
         foreign_keys="Task.destination_smb_id",
     )
     task_source: Mapped["Task"] = relationship(
-        backref="source_smb_conn", lazy=True, foreign_keys="Task.source_smb_id"
+        back_populates="source_smb_conn",
+        lazy="raise",
+        foreign_keys="Task.source_smb_id",
     )
     query_source: Mapped["Task"] = relationship(
-        backref="query_smb_conn", lazy=True, foreign_keys="Task.query_smb_id"
+        back_populates="query_smb_conn",
+        lazy="raise",
+        foreign_keys="Task.query_smb_id",
     )
     processing_source: Mapped["Task"] = relationship(
-        backref="processing_smb_conn",
-        lazy=True,
+        back_populates="processing_smb_conn",
+        lazy="raise",
         foreign_keys="Task.processing_smb_id",
     )
 
+    __table_args__ = (db.Index("ix_connection_smb_connection_id_name", "connection_id", "name"),)
+
     def __str__(self) -> str:
         """Get string of name."""
         return str(self.name)
@@ -435,8 +538,10 @@ class ConnectionDatabaseType(db.Model):
     __tablename__ = "connection_database_type"
 
     id: Mapped[intpk]
-    name: Mapped[Optional[str_120]]
-    database: Mapped["ConnectionDatabase"] = relationship(backref="database_type", lazy=True)
+    name: Mapped[Optional[str_120]] = mapped_column(index=True)
+    database: Mapped["ConnectionDatabase"] = relationship(
+        back_populates="database_type", lazy="raise"
+    )
 
 
 class ConnectionDatabase(db.Model):
@@ -446,16 +551,23 @@ class ConnectionDatabase(db.Model):
 
     id: Mapped[intpk]
     type_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(ConnectionDatabaseType.id))
-    connection_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(Connection.id), index=True)
+    connection_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(Connection.id))
     name: Mapped[Optional[str_500]]
     connection_string: Mapped[Optional[str]] = mapped_column(db.Text, nullable=True)
     timeout: Mapped[Optional[int]]
+    database_type: Mapped[Optional["ConnectionDatabaseType"]] = relationship(
+        back_populates="database", lazy="joined"
+    )
     task_source: Mapped["Task"] = relationship(
-        backref="source_database_conn",
-        lazy=True,
+        back_populates="source_database_conn",
+        lazy="raise",
         foreign_keys="Task.source_database_id",
     )
-    connection: Mapped["Connection"] = relationship(back_populates="database")
+    connection: Mapped["Connection"] = relationship(back_populates="database", lazy="select")
+
+    __table_args__ = (
+        db.Index("ix_connection_database_connection_id_name", "connection_id", "name"),
+    )
 
     def __str__(self) -> str:
         """Get string of name."""
@@ -468,9 +580,9 @@ class TaskDestinationFileType(db.Model):
     __tablename__ = "task_destination_file_type"
 
     id: Mapped[intpk]
-    name: Mapped[Optional[str_120]]
+    name: Mapped[Optional[str_120]] = mapped_column(index=True)
     ext: Mapped[Optional[str_120]] = mapped_column(nullable=False)
-    task: Mapped["Task"] = relationship(backref="file_type", lazy=True)
+    task: Mapped["Task"] = relationship(back_populates="file_type", lazy="raise")
 
 
 class QuoteLevel(db.Model):
@@ -479,8 +591,10 @@ class QuoteLevel(db.Model):
     __tablename__ = "quote_level"
 
     id: Mapped[intpk]
-    name: Mapped[Optional[str_120]]
-    task: Mapped["Task"] = relationship(backref="destination_file_quote_level", lazy=True)
+    name: Mapped[Optional[str_120]] = mapped_column(index=True)
+    task: Mapped["Task"] = relationship(
+        back_populates="destination_file_quote_level", lazy="raise"
+    )
 
 
 class ProjectParam(db.Model):
@@ -491,11 +605,15 @@ class ProjectParam(db.Model):
     id: Mapped[intpk]
     key: Mapped[Optional[str_500]]
     value: Mapped[Optional[str_8000]]
-    project_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(Project.id), index=True)
+    project_id: Mapped[Optional[int]] = mapped_column(
+        db.ForeignKey(Project.id, ondelete="CASCADE", deferrable=True, initially="DEFERRED"),
+        index=True,
+    )
     sensitive: Mapped[Optional[int]] = mapped_column(index=True)
+    project: Mapped[Optional["Project"]] = relationship(back_populates="params", lazy="select")
 
 
-class Task(db.Model):
+class Task(TimestampedMixin, db.Model):
     """Table containing task details."""
 
     # pylint: disable=too-many-instance-attributes
@@ -505,19 +623,16 @@ class Task(db.Model):
     # general information
     id: Mapped[intpk]
     name: Mapped[Optional[str_1000]]
-    project_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(Project.id), index=True)
+    project_id: Mapped[Optional[int]] = mapped_column(
+        db.ForeignKey(Project.id, ondelete="CASCADE", deferrable=True, initially="DEFERRED"),
+        index=True,
+    )
     status_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(TaskStatus.id))
-    enabled: Mapped[Optional[int]] = mapped_column(index=True)
-    order: Mapped[Optional[int]] = mapped_column(index=True)
+    enabled: Mapped[Optional[bool]]
+    order: Mapped[Optional[int]]
     last_run: Mapped[Optional[datetime.datetime]]
     last_run_job_id: Mapped[Optional[str_30]] = mapped_column(index=True)
     next_run: Mapped[Optional[datetime.datetime]] = mapped_column(index=True)
-    created: Mapped[Optional[timestamp]] = mapped_column(index=True)
-    creator_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(User.id), index=True)
-    updated: Mapped[Optional[datetime.datetime]] = mapped_column(
-        onupdate=functions.now(), index=True
-    )
-    updater_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(User.id), index=True)
 
     """ data source """
     # db/sftp/smb/ftp
@@ -544,10 +659,12 @@ class Task(db.Model):
     source_url: Mapped[Optional[str_1000]]
 
     # source typed code
-    source_code: Mapped[Optional[str]] = mapped_column(db.Text, nullable=True)
+    source_code: Mapped[Optional[str]] = mapped_column(
+        db.Text, nullable=True, deferred=True, deferred_group="task_code"
+    )
 
     # cached source query
-    source_cache: Mapped[Optional[str]] = mapped_column(db.Text, nullable=True)
+    source_cache: Mapped[Optional[str]] = mapped_column(db.Text, nullable=True, deferred=True)
     enable_source_cache: Mapped[Optional[int]] = mapped_column(index=True)
 
     query_smb_id: Mapped[Optional[int]] = mapped_column(
@@ -565,12 +682,14 @@ class Task(db.Model):
     )
     query_ftp_file: Mapped[Optional[str_1000]]
 
-    query_params: Mapped[Optional[str_8000]]
+    query_params: Mapped[Optional[str]] = mapped_column(
+        db.Text, nullable=True, deferred=True, deferred_group="task_code"
+    )
 
     # source smb sql file
     source_smb_file: Mapped[Optional[str_1000]]
     source_smb_delimiter: Mapped[Optional[str_10]]
-    source_smb_ignore_delimiter: Mapped[Optional[int]]
+    source_smb_ignore_delimiter: Mapped[Optional[bool]]
     source_smb_id: Mapped[Optional[int]] = mapped_column(
         db.ForeignKey(ConnectionSmb.id), index=True
     )
@@ -578,7 +697,7 @@ class Task(db.Model):
     # source ftp sql file
     source_ftp_file: Mapped[Optional[str_1000]]
     source_ftp_delimiter: Mapped[Optional[str_10]]
-    source_ftp_ignore_delimiter: Mapped[Optional[int]]
+    source_ftp_ignore_delimiter: Mapped[Optional[bool]]
     source_ftp_id: Mapped[Optional[int]] = mapped_column(
         db.ForeignKey(ConnectionFtp.id), index=True
     )
@@ -586,7 +705,7 @@ class Task(db.Model):
     # source sftp sql file
     source_sftp_file: Mapped[Optional[str_1000]]
     source_sftp_delimiter: Mapped[Optional[str_10]]
-    source_sftp_ignore_delimiter: Mapped[Optional[int]]
+    source_sftp_ignore_delimiter: Mapped[Optional[bool]]
     source_sftp_id: Mapped[Optional[int]] = mapped_column(
         db.ForeignKey(ConnectionSftp.id), index=True
     )
@@ -619,7 +738,9 @@ class Task(db.Model):
     )
     processing_ftp_file: Mapped[Optional[str_1000]]
 
-    processing_code: Mapped[Optional[str_8000]]
+    processing_code: Mapped[Optional[str]] = mapped_column(
+        db.Text, nullable=True, deferred=True, deferred_group="task_code"
+    )
     processing_url: Mapped[Optional[str_1000]]
     processing_git: Mapped[Optional[str_1000]]
     processing_devops: Mapped[Optional[str_1000]]
@@ -630,11 +751,11 @@ class Task(db.Model):
     # destination file
     destination_file_name: Mapped[Optional[str_1000]]
     destination_file_delimiter: Mapped[Optional[str_10]]
-    destination_ignore_delimiter: Mapped[Optional[int]]
+    destination_ignore_delimiter: Mapped[Optional[bool]]
     destination_file_line_terminator: Mapped[Optional[str_10]]
 
     # destination zip archive
-    destination_create_zip: Mapped[Optional[int]]
+    destination_create_zip: Mapped[Optional[bool]]
     destination_zip_name: Mapped[Optional[str_1000]]
 
     # csv/txt/other
@@ -643,29 +764,29 @@ class Task(db.Model):
     )
 
     # save to sftp server
-    destination_sftp: Mapped[Optional[int]] = mapped_column(index=True)
-    destination_sftp_overwrite: Mapped[Optional[int]]
+    destination_sftp: Mapped[Optional[bool]]
+    destination_sftp_overwrite: Mapped[Optional[bool]]
     destination_sftp_id: Mapped[Optional[int]] = mapped_column(
         db.ForeignKey(ConnectionSftp.id), index=True
     )
-    destination_sftp_dont_send_empty_file: Mapped[Optional[int]]
+    destination_sftp_dont_send_empty_file: Mapped[Optional[bool]]
 
     # save to ftp server
-    destination_ftp: Mapped[Optional[int]] = mapped_column(index=True)
-    destination_ftp_overwrite: Mapped[Optional[int]]
+    destination_ftp: Mapped[Optional[bool]]
+    destination_ftp_overwrite: Mapped[Optional[bool]]
     destination_ftp_id: Mapped[Optional[int]] = mapped_column(
         db.ForeignKey(ConnectionFtp.id), index=True
     )
-    destination_ftp_dont_send_empty_file: Mapped[Optional[int]]
+    destination_ftp_dont_send_empty_file: Mapped[Optional[bool]]
     # save to smb server
-    destination_smb: Mapped[Optional[int]] = mapped_column(index=True)
-    destination_smb_overwrite: Mapped[Optional[int]]
+    destination_smb: Mapped[Optional[bool]]
+    destination_smb_overwrite: Mapped[Optional[bool]]
     destination_smb_id: Mapped[Optional[int]] = mapped_column(
         db.ForeignKey(ConnectionSmb.id), index=True
     )
-    destination_smb_dont_send_empty_file: Mapped[Optional[int]]
+    destination_smb_dont_send_empty_file: Mapped[Optional[bool]]
 
-    file_gpg: Mapped[Optional[int]] = mapped_column(index=True)
+    file_gpg: Mapped[Optional[bool]]
     file_gpg_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(ConnectionGpg.id), index=True)
 
     destination_quote_level_id: Mapped[Optional[int]] = mapped_column(
@@ -674,50 +795,159 @@ class Task(db.Model):
 
     """ email """
     # completion email
-    email_completion: Mapped[Optional[int]] = mapped_column(index=True)
-    email_completion_log: Mapped[Optional[int]]
-    email_completion_file: Mapped[Optional[int]]
-    email_completion_file_embed: Mapped[Optional[int]]
+    email_completion: Mapped[Optional[bool]]
+    email_completion_log: Mapped[Optional[bool]]
+    email_completion_file: Mapped[Optional[bool]]
+    email_completion_file_embed: Mapped[Optional[bool]]
     email_completion_recipients: Mapped[Optional[str_1000]]
     email_completion_subject: Mapped[Optional[str_8000]]
-    email_completion_message: Mapped[Optional[str_8000]]
-    email_completion_dont_send_empty_file: Mapped[Optional[int]]
+    email_completion_message: Mapped[Optional[str]] = mapped_column(
+        db.Text, nullable=True, deferred=True, deferred_group="task_email"
+    )
+    email_completion_dont_send_empty_file: Mapped[Optional[bool]]
 
     # error email
-    email_error: Mapped[Optional[int]]
+    email_error: Mapped[Optional[bool]]
     email_error_recipients: Mapped[Optional[str_1000]]
     email_error_subject: Mapped[Optional[str_8000]]
-    email_error_message: Mapped[Optional[str_8000]]
+    email_error_message: Mapped[Optional[str]] = mapped_column(
+        db.Text, nullable=True, deferred=True, deferred_group="task_email"
+    )
 
     # rerun on fail
-    max_retries: Mapped[Optional[int]] = mapped_column(index=True)
+    max_retries: Mapped[Optional[int]]
 
     est_duration: Mapped[Optional[int]] = mapped_column(index=True)
 
+    # parent links
+    project: Mapped[Optional["Project"]] = relationship(back_populates="task", lazy="joined")
+    status: Mapped[Optional["TaskStatus"]] = relationship(back_populates="task", lazy="select")
+    task_creator: Mapped[Optional["User"]] = relationship(
+        back_populates="task_creator", lazy="select", foreign_keys="Task.creator_id"
+    )
+    task_updater: Mapped[Optional["User"]] = relationship(
+        back_populates="task_updater", lazy="select", foreign_keys="Task.updater_id"
+    )
+    source_type: Mapped[Optional["TaskSourceType"]] = relationship(
+        back_populates="task", lazy="select"
+    )
+    query_type: Mapped[Optional["TaskSourceQueryType"]] = relationship(
+        back_populates="task", lazy="select"
+    )
+    processing_type: Mapped[Optional["TaskProcessingType"]] = relationship(
+        back_populates="task", lazy="select"
+    )
+    file_type: Mapped[Optional["TaskDestinationFileType"]] = relationship(
+        back_populates="task", lazy="select"
+    )
+    destination_file_quote_level: Mapped[Optional["QuoteLevel"]] = relationship(
+        back_populates="task", lazy="select"
+    )
+
+    # connection links
+    destination_sftp_conn: Mapped[Optional["ConnectionSftp"]] = relationship(
+        back_populates="task", lazy="joined", foreign_keys=[destination_sftp_id]
+    )
+    source_sftp_conn: Mapped[Optional["ConnectionSftp"]] = relationship(
+        back_populates="task_source", lazy="joined", foreign_keys=[source_sftp_id]
+    )
+    query_sftp_conn: Mapped[Optional["ConnectionSftp"]] = relationship(
+        back_populates="query_source", lazy="joined", foreign_keys=[query_sftp_id]
+    )
+    processing_sftp_conn: Mapped[Optional["ConnectionSftp"]] = relationship(
+        back_populates="processing_source", lazy="joined", foreign_keys=[processing_sftp_id]
+    )
+    destination_ftp_conn: Mapped[Optional["ConnectionFtp"]] = relationship(
+        back_populates="task", lazy="joined", foreign_keys=[destination_ftp_id]
+    )
+    source_ftp_conn: Mapped[Optional["ConnectionFtp"]] = relationship(
+        back_populates="task_source", lazy="joined", foreign_keys=[source_ftp_id]
+    )
+    query_ftp_conn: Mapped[Optional["ConnectionFtp"]] = relationship(
+        back_populates="query_source", lazy="joined", foreign_keys=[query_ftp_id]
+    )
+    processing_ftp_conn: Mapped[Optional["ConnectionFtp"]] = relationship(
+        back_populates="processing_source", lazy="joined", foreign_keys=[processing_ftp_id]
+    )
+    destination_smb_conn: Mapped[Optional["ConnectionSmb"]] = relationship(
+        back_populates="task", lazy="joined", foreign_keys=[destination_smb_id]
+    )
+    source_smb_conn: Mapped[Optional["ConnectionSmb"]] = relationship(
+        back_populates="task_source", lazy="joined", foreign_keys=[source_smb_id]
+    )
+    query_smb_conn: Mapped[Optional["ConnectionSmb"]] = relationship(
+        back_populates="query_source", lazy="joined", foreign_keys=[query_smb_id]
+    )
+    processing_smb_conn: Mapped[Optional["ConnectionSmb"]] = relationship(
+        back_populates="processing_source", lazy="joined", foreign_keys=[processing_smb_id]
+    )
+    source_ssh_conn: Mapped[Optional["ConnectionSsh"]] = relationship(
+        back_populates="task_source", lazy="joined", foreign_keys=[source_ssh_id]
+    )
+    file_gpg_conn: Mapped[Optional["ConnectionGpg"]] = relationship(
+        back_populates="task_source", lazy="joined", foreign_keys=[file_gpg_id]
+    )
+    source_database_conn: Mapped[Optional["ConnectionDatabase"]] = relationship(
+        back_populates="task_source", lazy="joined", foreign_keys=[source_database_id]
+    )
+
     # tasklog link
     task: Mapped[List["TaskLog"]] = relationship(
-        backref="task",
-        lazy=True,
+        back_populates="task",
+        lazy="raise",
         cascade="all, delete, delete-orphan",
         passive_deletes=True,
     )
 
     # taskparams link
     params: Mapped[List["TaskParam"]] = relationship(
-        backref="task",
-        lazy=True,
+        back_populates="task",
+        lazy="select",
         cascade="all, delete, delete-orphan",
         passive_deletes=True,
     )
 
     # taskfiles link
     files: Mapped[List["TaskFile"]] = relationship(
-        backref="task",
-        lazy=True,
+        back_populates="task",
+        lazy="raise",
         cascade="all, delete, delete-orphan",
         passive_deletes=True,
     )
 
+    __table_args__ = (
+        db.Index(
+            "ix_task_sched",
+            "enabled",
+            "next_run",
+            postgresql_include=["id", "project_id", "max_retries", "status_id"],
+        ),
+        db.Index("ix_task_project_order", "project_id", "order"),
+        db.Index("ix_task_status_enabled", "status_id", "enabled"),
+        # partial indexes on the flags, only the "on" rows are ever filtered for.
+        db.Index("ix_task_enabled_true", "id", postgresql_where=db.text("enabled")),
+        db.Index(
+            "ix_task_destination_sftp_true", "id", postgresql_where=db.text("destination_sftp")
+        ),
+        db.Index(
+            "ix_task_destination_ftp_true", "id", postgresql_where=db.text("destination_ftp")
+        ),
+        db.Index(
+            "ix_task_destination_smb_true", "id", postgresql_where=db.text("destination_smb")
+        ),
+        db.Index("ix_task_file_gpg_true", "id", postgresql_where=db.text("file_gpg")),
+        db.Index(
+            "ix_task_email_completion_true", "id", postgresql_where=db.text("email_completion")
+        ),
+        db.Index("ix_task_email_error_true", "id", postgresql_where=db.text("email_error")),
+        db.Index("ix_task_max_retries_set", "id", postgresql_where=db.text("max_retries > 0")),
+    )
+
+    @property
+    def status_name(self) -> Optional[str]:
+        """Get status name from the lookup cache."""
+        return _lookup(TaskStatus, self.status_id)
+
     def __str__(self) -> str:
         """Return default string."""
         return str(self.name)
@@ -730,17 +960,33 @@ class TaskLog(db.Model):
 
     __tablename__ = "task_log"
 
-    job_id: Mapped[Optional[str_1000]] = mapped_column(index=True)
+    job_id: Mapped[Optional[str_30]] = mapped_column(index=True)
     id: Mapped[intpk]
-    task_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(Task.id), index=True)
+    task_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(Task.id, ondelete="CASCADE"))
     status_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(TaskStatus.id), index=True)
     message: Mapped[Optional[str]] = mapped_column(db.Text, nullable=True)
-    status_date: Mapped[Optional[datetime.datetime]] = mapped_column(
-        default=datetime.datetime.now, index=True
-    )
+    status_date: Mapped[Optional[datetime.datetime]] = mapped_column(default=datetime.datetime.now)
     error: Mapped[Optional[int]] = mapped_column(index=True)
+    task: Mapped[Optional["Task"]] = relationship(back_populates="task", lazy="select")
+    status: Mapped[Optional["TaskStatus"]] = relationship(back_populates="task_log", lazy="select")
+
+    # log is append only, so status_date follows the physical row order. brin covers
+    # date range scans, the btree covers the per task listing, which seeks on id.
+    __table_args__ = (
+        db.Index("ix_task_log_status_date_error", "status_date", "error"),
+        db.Index("ix_task_log_task_id_id", "task_id", "id"),
+        db.Index(
+            "ix_task_log_status_date_brin",
+            "status_date",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
-    __table_args__ = (db.Index("ix_task_log_status_date_error", "status_date", "error"),)
+    @property
+    def status_name(self) -> Optional[str]:
+        """Get status name from the lookup cache."""
+        return _lookup(TaskStatus, self.status_id)
 
 
 class TaskFile(db.Model):
@@ -750,14 +996,17 @@ class TaskFile(db.Model):
 
     id: Mapped[intpk]
     name: Mapped[Optional[str_1000]] = mapped_column(index=True)
-    task_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(Task.id), index=True)
-    job_id: Mapped[Optional[str_1000]] = mapped_column(index=True)
+    task_id: Mapped[Optional[int]] = mapped_column(
+        db.ForeignKey(Task.id, ondelete="CASCADE"), index=True
+    )
+    job_id: Mapped[Optional[str_30]] = mapped_column(index=True)
     size: Mapped[Optional[str_200]] = mapped_column(index=True)
     path: Mapped[Optional[str_1000]] = mapped_column(index=True)
     file_hash: Mapped[Optional[str_1000]]
     created: Mapped[Optional[datetime.datetime]] = mapped_column(
         default=datetime.datetime.now, index=True
     )
+    task: Mapped[Optional["Task"]] = relationship(back_populates="files", lazy="select")
 
     __table_args__ = (db.Index("ix_task_file_id_task_id_job_id", "id", "task_id", "job_id"),)
 
@@ -770,5 +1019,61 @@ class TaskParam(db.Model):
     id: Mapped[intpk]
     key: Mapped[Optional[str_500]]
     value: Mapped[Optional[str_8000]]
-    task_id: Mapped[Optional[int]] = mapped_column(db.ForeignKey(Task.id), index=True)
+    task_id: Mapped[Optional[int]] = mapped_column(
+        db.ForeignKey(Task.id, ondelete="CASCADE"), index=True
+    )
     sensitive: Mapped[Optional[int]] = mapped_column(index=True)
+    task: Mapped[Optional["Task"]] = relationship(back_populates="params", lazy="select")
+
+
+# loader options for bulk task queries that only need the project. the
+# connection joins are skipped, and any other relationship access raises.
+TASK_LIST_OPTIONS = (joinedload(Task.project), raiseload("*"))
+
+# loader options for single task pages. the connection rows are already joined
+# and the templates show their parent connection name, so join that too. the
+# parent's own collections are left lazy.
+TASK_DETAIL_OPTIONS = (
+    joinedload(Task.file_type),
+    joinedload(Task.destination_file_quote_level),
+    *(
+        joinedload(rel).joinedload(conn.connection).lazyload("*")
+        for rel, conn in (
+            (Task.destination_sftp_conn, ConnectionSftp),
+            (Task.source_sftp_conn, ConnectionSftp),
+            (Task.query_sftp_conn, ConnectionSftp),
+            (Task.processing_sftp_conn, ConnectionSftp),
+            (Task.destination_ftp_conn, ConnectionFtp),
+            (Task.source_ftp_conn, ConnectionFtp),
+            (Task.query_ftp_conn, ConnectionFtp),
+            (Task.processing_ftp_conn, ConnectionFtp),
+            (Task.destination_smb_conn, ConnectionSmb),
+            (Task.source_smb_conn, ConnectionSmb),
+            (Task.query_smb_conn, ConnectionSmb),
+            (Task.processing_smb_conn, ConnectionSmb),
+            (Task.source_ssh_conn, ConnectionSsh),
+            (Task.file_gpg_conn, ConnectionGpg),
+            (Task.source_database_conn, ConnectionDatabase),
+        )
+    ),
+)
+
+
+# lookup rows almost never change, but drop the cached names when they do.
+def _clear_lookup_cache(*args: object) -> None:
+    """Drop cached lookup names when a lookup row changes."""
+    _lookup_names.cache_clear()
+
+
+for _model in (
+    LoginType,
+    TaskSourceType,
+    TaskSourceQueryType,
+    TaskProcessingType,
+    TaskStatus,
+    ConnectionDatabaseType,
+    TaskDestinationFileType,
+    QuoteLevel,
+):
+    for _event in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event, _clear_lookup_cache)
@@ -6,17 +6,53 @@ Returns schedules in a readable format.
 
 import calendar
 import datetime
+import functools
 import re
-from typing import Any, Callable, ClassVar, List, Optional
+from itertools import groupby
+from typing import Any, Callable, ClassVar, Optional
+
+LAST_WEEK_DAY = re.compile(r"^last\s\D{3}$", re.IGNORECASE)
+
+# calendar's name lists are proxies that rebuild each name on access.
+DAY_NAMES = tuple(calendar.day_name)
+MONTH_NAMES = tuple(calendar.month_name)
+DAY_ABBR_INDEX = {v.upper(): k for (k, v) in enumerate(calendar.day_abbr)}
+MONTH_ABBR_INDEX = {v.upper(): k for (k, v) in enumerate(calendar.month_abbr)}
+
+# 12 hour clock label and period for each hour of the day.
+HOUR_FORMATS = tuple((f"{(h % 12) or 12:02d}", "PM" if h >= 12 else "AM") for h in range(24))
+
+
+def get_day_name(s: str) -> str:
+    """Get a day name from a cron day number or abbreviation."""
+    try:
+        return DAY_NAMES[int(s)]
+    except (IndexError, ValueError):
+        pass
+    index = DAY_ABBR_INDEX.get(s.upper())
+    return s if index is None else DAY_NAMES[index]
+
+
+def get_month_name(s: str) -> str:
+    """Get a month name from a cron month number or abbreviation."""
+    try:
+        return MONTH_NAMES[int(s)]
+    except (IndexError, ValueError):
+        pass
+    index = MONTH_ABBR_INDEX.get(s.upper())
+    return s if index is None else MONTH_NAMES[index]
+
+
+def remove_adjacent_duplicates(sentence: str) -> str:
+    """Remove duplicate words that might pop up such as week week."""
+    return " ".join(word for word, _ in groupby(sentence.split()))
 
 
 class ExpressionDescriptor:
     """Converts a Cron Expression into a human readable string."""
 
-    _cron_days: ClassVar[dict[str, int]] = {
-        v.upper(): k for (k, v) in enumerate(calendar.day_abbr)
-    }
-    _special_characters: ClassVar[List[str]] = ["/", "-", ",", "*"]
+    _special_characters: ClassVar[frozenset[str]] = frozenset("/-,*")
+    _segment_separators: ClassVar[frozenset[str]] = frozenset("/-, ")
 
     def __init__(
         self,
@@ -30,14 +66,42 @@ class ExpressionDescriptor:
         cron_sec: str = "0",
     ) -> None:
         """Initializes a new instance of the ExpressionDescriptor."""
-        self.cron_year = "*" if cron_year is None or cron_year == "" else cron_year
-        self.cron_month = "*" if cron_month is None or cron_month == "" else cron_month
-        self.cron_week = "*" if cron_week is None or cron_week == "" else cron_week
-        self.cron_day = "*" if cron_day is None or cron_day == "" else cron_day
-        self.cron_week_day = "*" if cron_week_day is None or cron_week_day == "" else cron_week_day
-        self.cron_hour = "0" if cron_hour is None or cron_hour == "" else cron_hour
-        self.cron_min = "0" if cron_min is None or cron_min == "" else cron_min
-        self.cron_sec = "0" if cron_sec is None or cron_sec == "" else cron_sec
+        self.cron_year = cron_year or "*"
+        self.cron_month = cron_month or "*"
+        self.cron_week = cron_week or "*"
+        self.cron_day = cron_day or "*"
+        self.cron_week_day = cron_week_day or "*"
+        self.cron_hour = cron_hour or "0"
+        self.cron_min = cron_min or "0"
+        self.cron_sec = cron_sec or "0"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def describe(
+        cron_year: str = "*",
+        cron_month: str = "*",
+        cron_week: str = "*",
+        cron_day: str = "*",
+        cron_week_day: str = "*",
+        cron_hour: str = "0",
+        cron_min: str = "0",
+        cron_sec: str = "0",
+    ) -> str:
+        """Get the full description of an expression, cached by its parts.
+
+        Projects on the same schedule share one description, so repeat
+        renders skip the parsing.
+        """
+        return ExpressionDescriptor(
+            cron_year,
+            cron_month,
+            cron_week,
+            cron_day,
+            cron_week_day,
+            cron_hour,
+            cron_min,
+            cron_sec,
+        ).get_full_description()
 
     def get_full_description(self) -> str:
         """Generates the FULL description.
@@ -49,18 +113,6 @@ class ExpressionDescriptor:
             FormatException: if formatting fails
 
         """
-
-        def remove_adjacent_duplicates(sentence: str) -> str:
-            """Remove duplicate words that might pop up such as week week."""
-            words = sentence.split()
-            unique_words = [words[0]]  # Initialize unique words list with the first word
-            for word in words[1:]:
-                if (
-                    word != unique_words[-1]
-                ):  # Check if the current word is different from the previous word
-                    unique_words.append(word)
-            return " ".join(unique_words)
-
         try:
             time_segment = self.get_time_of_day_description()
             day_of_month_desc = self.get_day_of_month_description()
@@ -97,9 +149,9 @@ class ExpressionDescriptor:
 
         # handle special cases first
         if (
-            any(exp in minute_expression for exp in self._special_characters) is False
-            and any(exp in hour_expression for exp in self._special_characters) is False
-            and any(exp in seconds_expression for exp in self._special_characters) is False
+            self._special_characters.isdisjoint(minute_expression)
+            and self._special_characters.isdisjoint(hour_expression)
+            and self._special_characters.isdisjoint(seconds_expression)
         ):
             # specific time of day (i.e. 10 14)
             description = (
@@ -110,7 +162,7 @@ class ExpressionDescriptor:
             seconds_expression == ""
             and "-" in minute_expression
             and "," not in minute_expression
-            and any(exp in hour_expression for exp in self._special_characters) is False
+            and self._special_characters.isdisjoint(hour_expression)
         ):
             # minute range in single hour (i.e. 0-10 11)
             minute_parts = minute_expression.split("-")
@@ -120,19 +172,13 @@ class ExpressionDescriptor:
             seconds_expression == ""
             and "," in hour_expression
             and "-" not in hour_expression
-            and any(exp in minute_expression for exp in self._special_characters) is False
+            and self._special_characters.isdisjoint(minute_expression)
         ):
             # hours list with single minute (o.e. 30 6,14,16)
-            hour_parts = hour_expression.split(",")
-            description = "At" + "".join(
-                f" {self.format_time(hour_part, minute_expression)}"
-                + (
-                    ","
-                    if i < len(hour_parts) - 2
-                    else (" and" if i == len(hour_parts) - 2 else "")
-                )
-                for i, hour_part in enumerate(hour_parts)
-            )
+            times = [
+                self.format_time(hour, minute_expression) for hour in hour_expression.split(",")
+            ]
+            description = f"At {', '.join(times[:-1])} and {times[-1]}"
 
         else:
             # default time description
@@ -221,21 +267,10 @@ class ExpressionDescriptor:
             # or a dupe description like "every day, every day".
             return ""
 
-        def get_day_name(s: str) -> str:
-            try:
-                return calendar.day_name[int(s)]
-            except (IndexError, ValueError):
-                pass
-            try:
-                return calendar.day_name[list(calendar.day_abbr).index(s.title())]
-            except ValueError:
-                pass
-            return s
-
         return self.get_segment_description(
             self.cron_week_day,
             ", every day",
-            lambda s: get_day_name(s),
+            get_day_name,
             lambda s: f", every {s} days of the week",
             lambda s: ", {0} through {1}",
             lambda s: ", only on {0}",
@@ -268,22 +303,10 @@ class ExpressionDescriptor:
             The MONTH description
 
         """
-
-        def get_month_name(s: str) -> str:
-            try:
-                return calendar.month_name[int(s)]
-            except (IndexError, ValueError):
-                pass
-            try:
-                return calendar.month_name[list(calendar.month_abbr).index(s.title())]
-            except ValueError:
-                pass
-            return s
-
         return self.get_segment_description(
             self.cron_month,
             "",
-            lambda s: get_month_name(s),
+            get_month_name,
             lambda s: f", every {s} months",
             lambda s: ", {0} through {1}",
             lambda s: ", only in {0}",
@@ -313,9 +336,11 @@ class ExpressionDescriptor:
         exp = self.cron_day
         if exp.lower() == "last":
             description = ", on the last day of the month"
-        elif re.match(r"^last\s\D{3}$", exp, re.IGNORECASE):
+        elif LAST_WEEK_DAY.match(exp):
             parts = exp.split()
-            description = f", on the last {calendar.day_name[self._cron_days[parts[1].upper()]]} of the month"
+            description = (
+                f", on the last {DAY_NAMES[DAY_ABBR_INDEX[parts[1].upper()]]} of the month"
+            )
 
         else:
             description = str(
@@ -383,7 +408,7 @@ class ExpressionDescriptor:
             description = ""
         elif expression == "*":
             description = all_description
-        elif not any(ext in expression for ext in ["/", "-", ",", " "]):
+        elif self._segment_separators.isdisjoint(expression):
             description = get_description_format(expression).format(
                 get_single_item_description(expression)
             )
@@ -416,12 +441,10 @@ class ExpressionDescriptor:
                 description_content = description_content.replace("of the month", "")
 
             description = get_description_format(expression).format(description_content)
-        elif " " in expression and not any(ext in expression for ext in ["/", "-", ","]):
+        elif " " in expression and "/" not in expression and "-" not in expression:
             daypart = expression.split()
-            if len(daypart) > 1 and daypart[1].lower() in map(str.lower, calendar.day_abbr):
-                expression = (
-                    f"{daypart[0]} {calendar.day_name[self._cron_days[daypart[1].upper()]]}"
-                )
+            if len(daypart) > 1 and daypart[1].upper() in DAY_ABBR_INDEX:
+                expression = f"{daypart[0]} {DAY_NAMES[DAY_ABBR_INDEX[daypart[1].upper()]]}"
             description = get_description_format(expression).format(
                 get_single_item_description(expression)
             )
@@ -442,7 +465,7 @@ class ExpressionDescriptor:
                     description += ", "
 
                 description += between_segment_description
-            elif not any(ext in segments[0] for ext in ["*", ","]):
+            elif "*" not in segments[0]:
                 range_item_description = get_description_format(segments[0]).format(
                     get_single_item_description(segments[0])
                 )
@@ -500,32 +523,32 @@ class ExpressionDescriptor:
             Formatted time description.
 
         """
-        hour = int(hour_expression)
-
-        period = ""
-
-        period = "PM" if (hour >= 12) else "AM"
-        if period:
-            # add preceding space
-            period = " " + period
-
-        if hour > 12:
-            hour -= 12
-
-        if hour == 0:
-            hour = 12
+        hour, period = HOUR_FORMATS[int(hour_expression)]
 
         minute = str(int(minute_expression))  # Removes leading zero if any
         second = ""
         if second_expression is not None and second_expression:
             second = f":{str(int(second_expression)).zfill(2)}"
 
-        return f"{str(hour).zfill(2)}:{minute.zfill(2)}{second}{period}"
+        return f"{hour}:{minute.zfill(2)}{second} {period}"
+
+    def _cached_description(self) -> str:
+        """Get the full description through the describe cache."""
+        return self.describe(
+            self.cron_year,
+            self.cron_month,
+            self.cron_week,
+            self.cron_day,
+            self.cron_week_day,
+            self.cron_hour,
+            self.cron_min,
+            self.cron_sec,
+        )
 
     def __str__(self) -> str:
         """Call the full description if this method is called."""
-        return self.get_full_description()
+        return self._cached_description()
 
     def __repr__(self) -> str:
         """Call the full description if this method is called."""
-        return self.get_full_description()
+        return self._cached_description()
@@ -8,6 +8,21 @@ import calendar
 import re
 from typing import ClassVar, Optional
 
+NUMBER = re.compile(r"^\d*$")
+NUMBER_RANGE = re.compile(r"^\d*-\d*$")
+NUMBER_STEP = re.compile(r"^\d*/\d*$")
+NUMBER_RANGE_STEP = re.compile(r"^\d*-\d*/\d*$")
+ALL_STEP = re.compile(r"^\*/\d*$")
+TWO_DIGIT_NUMBERS = re.compile(
+    r"^(\*|(\d{1,2})-(\d{1,2})(/(\d{1,2}))?|\*/\d{1,2}|\d{1,2}(/\d{1,2})?)$"
+)
+ONE_DIGIT_NUMBERS = re.compile(r"^(\*|(\d{1})-(\d{1})(/(\d{1}))?|\*/\d{1}|\d{1}(/\d{1})?)$")
+NTH_WEEK_DAY = re.compile(r"^[1-5](nd|st|rd|th)\s\D{3}$", re.IGNORECASE)
+LAST_WEEK_DAY = re.compile(r"^last\s\D{3}$", re.IGNORECASE)
+ORDINAL_SUFFIX = re.compile("[nd|st|rd|th]")
+NAME = re.compile(r"\D{3}$")
+NAME_RANGE = re.compile(r"\D{3}-\D{3}$")
+
 
 class CronValidator:
     """Group of functions to make sure each cron field is correct."""
@@ -67,21 +82,21 @@ class CronValidator:
         """
         if expr is None or expr == "" or expr == "*":
             pass
-        elif re.match(r"^\d*$", expr):
+        elif NUMBER.match(expr):
             self.check_range(expr=expr, mi=mi, mx=mx, prefix=prefix)
 
-        elif re.match(r"^\d*-\d*$", expr):
+        elif NUMBER_RANGE.match(expr):
             parts = expr.split("-")
             self.check_range(expr=parts[0], mi=mi, mx=mx, prefix=prefix)
             self.check_range(expr=parts[1], mi=mi, mx=mx, prefix=prefix)
             self.compare_range(st=int(parts[0]), ed=int(parts[1]), mi=mi, mx=mx, prefix=prefix)
 
-        elif re.match(r"^\d*/\d*$", expr):
+        elif NUMBER_STEP.match(expr):
             parts = expr.split("/")
             self.check_range(expr=parts[0], mi=mi, mx=mx, prefix=prefix)
             self.check_range(type="interval", expr=parts[1], mi=1, mx=mx, prefix=prefix)
 
-        elif re.match(r"^\d*-\d*/\d*$", expr):
+        elif NUMBER_RANGE_STEP.match(expr):
             parts = expr.split("/")
             fst_parts = parts[0].split("-")
             self.check_range(expr=fst_parts[0], mi=mi, mx=mx, prefix=prefix)
@@ -91,7 +106,7 @@ class CronValidator:
             )
             self.check_range(type="interval", expr=parts[1], mi=1, mx=mx, prefix=prefix)
 
-        elif re.match(r"^\*/\d*$", expr):
+        elif ALL_STEP.match(expr):
             parts = expr.split("/")
             self.check_range(type="interval", expr=parts[1], mi=1, mx=mx, prefix=prefix)
 
@@ -134,21 +149,18 @@ class CronValidator:
                 for dayofmonth in expr_ls:
                     self._day_of_month(expr=dayofmonth.strip(), prefix=prefix)
         # if it is number only then just use _number_validate function
-        elif re.match(
-            r"^(\*|(\d{1,2})-(\d{1,2})(/(\d{1,2}))?|\*/\d{1,2}|\d{1,2}(/\d{1,2})?)$",
-            expr,
-        ):
+        elif TWO_DIGIT_NUMBERS.match(expr):
             self._number_validate(expr=expr, prefix=prefix, mi=mi, mx=mx, limit=31)
-        elif re.match(r"^[1-5](nd|st|rd|th)\s\D{3}$", expr, re.IGNORECASE):
+        elif NTH_WEEK_DAY.match(expr):
             parts = expr.split()
-            parts[0] = re.sub("[nd|st|rd|th]", "", parts[0])
+            parts[0] = ORDINAL_SUFFIX.sub("", parts[0])
             try:
                 self._cron_days[parts[1].upper()]
             except KeyError:
                 msg = f"({prefix}) Invalid value '{expr}'"
                 raise ValueError(msg)
             self.check_range(expr=parts[0], mi=mi, mx=5, prefix=prefix)
-        elif re.match(r"^last\s\D{3}$", expr, re.IGNORECASE):
+        elif LAST_WEEK_DAY.match(expr):
             parts = expr.split()
             try:
                 self._cron_days[parts[1].upper()]
@@ -188,18 +200,15 @@ class CronValidator:
                 for mon in expr_ls:
                     self._month(expr=mon.strip(), prefix=prefix)
         # if it is number only then just use _number_validate function
-        elif re.match(
-            r"^(\*|(\d{1,2})-(\d{1,2})(/(\d{1,2}))?|\*/\d{1,2}|\d{1,2}(/\d{1,2})?)$",
-            expr,
-        ):
+        elif TWO_DIGIT_NUMBERS.match(expr):
             self._number_validate(expr=expr, prefix=prefix, mi=mi, mx=mx, limit=12)
-        elif re.match(r"\D{3}$", expr):
+        elif NAME.match(expr):
             try:
                 st_mon = int(self._cron_months[expr.upper()])
             except KeyError:
                 msg = f"Invalid Month value '{expr}'"
                 raise ValueError(msg)
-        elif re.match(r"\D{3}-\D{3}$", expr):
+        elif NAME_RANGE.match(expr):
             parts = expr.split("-")
             try:
                 st_mon = int(self._cron_months[parts[0].upper()])
@@ -245,9 +254,9 @@ class CronValidator:
                 for day in expr_ls:
                     self._day_of_week(expr=day.strip(), prefix=prefix)
         # if it is number only then just use _number_validate function
-        elif re.match(r"^(\*|(\d{1})-(\d{1})(/(\d{1}))?|\*/\d{1}|\d{1}(/\d{1})?)$", expr):
+        elif ONE_DIGIT_NUMBERS.match(expr):
             self._number_validate(expr=expr, prefix=prefix, mi=mi, mx=mx, limit=7)
-        elif re.match(r"\D{3}-\D{3}$", expr):
+        elif NAME_RANGE.match(expr):
             parts = expr.split("-")
             try:
                 st_day = self._cron_days[parts[0].upper()]
@@ -1,10 +1,12 @@
 import os
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Generator, Tuple
+from typing import Any, Callable, ContextManager, Generator, List, Tuple
 
 import pytest
 from dateutil.tz import tzlocal
 from flask import url_for
+from sqlalchemy import event
 from sqlalchemy_utils import create_database, database_exists, drop_database
 
 from web import create_app as web_create_app
@@ -24,8 +26,9 @@ def client_fixture() -> Generator:
     with app.test_client() as client, app.app_context():
         assert app.config["ENV"] == "test"
 
-        from web.extensions import db
+        from web.extensions import db, redis_client
         from web.model import User
+        from web.web.task_edit import clear_task_form_options
 
         if database_exists(db.engine.url):
             drop_database(db.engine.url)
@@ -38,6 +41,9 @@ def client_fixture() -> Generator:
         db.session.commit()
 
         seed(db.session, model)
+        clear_task_form_options()
+        for key in redis_client.scan_iter("atlas_hub_task_hello-*"):
+            redis_client.delete(key)
 
         get_or_create(
             db.session,
@@ -68,6 +74,36 @@ def client_fixture() -> Generator:
         drop_database(db.engine.url)
 
 
+@pytest.fixture(scope="function")
+def assert_max_queries() -> Callable[[int], ContextManager[List[str]]]:
+    """Fail if the block runs more than the given number of sql statements.
+
+    .. code::
+
+        with assert_max_queries(2):
+            client_fixture.get("/task/sftp-dest?org=1")
+    """
+
+    @contextmanager
+    def counter(limit: int) -> Generator[List[str], None, None]:
+        from web.extensions import db
+
+        queries: List[str] = []
+
+        def count(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+            queries.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", count)
+        try:
+            yield queries
+        finally:
+            event.remove(db.engine, "before_cursor_execute", count)
+
+        assert len(queries) <= limit, "\n\n".join(queries)
+
+    return counter
+
+
 def check_url(client, url: str, flash: bool = False) -> str:  # type: ignore[no-untyped-def]
     page = client.get(url, follow_redirects=True)
     assert page.status_code == 200
@@ -17,7 +17,7 @@ import json
 from pytest import fixture
 
 from web import db
-from web.model import Task
+from web.model import Task, TaskLog
 
 from .conftest import create_demo_task
 
@@ -102,6 +102,11 @@ def test_table_my_tasks_list(client_fixture: fixture) -> None:
 def test_table_all_tasks_list(client_fixture: fixture) -> None:
     assert client_fixture.get("/table/tasks/all/list").status_code == 200
 
+    # sort direction is not passed through to the sql
+    page = client_fixture.get("/table/tasks/all/list?s=Name.desc; select 1")
+    assert page.status_code == 200
+    assert len(json.loads(page.get_data(as_text=True)))
+
 
 def test_table_project_tasks(client_fixture: fixture) -> None:
     assert client_fixture.get("/table/project/1/task").status_code == 200
@@ -129,3 +134,15 @@ def test_table_tasks_files(client_fixture: fixture) -> None:
     task = Task.query.first()
     if task:
         assert client_fixture.get("/table/task/" + str(task.id) + "/files").status_code == 200
+
+
+def test_table_task_log_queries(client_fixture: fixture, assert_max_queries: fixture) -> None:
+    _, t_id = create_demo_task(db.session)
+    for x in range(5):
+        db.session.add(TaskLog(task_id=t_id, status_id=1, message=f"log {x}"))
+    db.session.commit()
+
+    # one count and one page query, nothing per log row.
+    with assert_max_queries(2):
+        page = client_fixture.get(f"/table/task/{t_id}/log")
+    assert len(json.loads(page.get_data(as_text=True))) == 7
@@ -19,6 +19,7 @@ from flask import request, url_for
 from pytest import fixture
 
 from web.extensions import db
+from web.model import Task, TaskLog, TaskParam
 
 from .conftest import create_demo_task
 
@@ -47,6 +48,32 @@ def test_run_valid_task(client_fixture: fixture) -> None:
     assert "Failed to run task." in page.get_data(as_text=True)
 
 
+def test_run_sequence_task(client_fixture: fixture) -> None:
+    _, t_id = create_demo_task(db.session, 2025, sequence=1)
+    task = db.session.get(Task, t_id)
+    task.enabled = 1
+    db.session.commit()
+
+    page = client_fixture.get(
+        url_for("task_controls_bp.run_task", task_id=t_id), follow_redirects=True
+    )
+    assert page.status_code == 200
+    assert "Failed to run task." in page.get_data(as_text=True)
+    assert TaskLog.query.filter_by(task_id=t_id, error=1).count() == 1
+
+
+def test_task_status(client_fixture: fixture, assert_max_queries: fixture) -> None:
+    _, t_id = create_demo_task(db.session)
+    db.session.expunge_all()
+
+    # one narrow select of the status columns
+    with assert_max_queries(1) as queries:
+        page = client_fixture.get(url_for("task_controls_bp.task_status", task_id=t_id))
+    assert page.status_code == 200
+    assert "JOIN" not in queries[0]
+    assert "status" in page.json
+
+
 def test_scheduler_invalid_task(client_fixture: fixture) -> None:
     # test invalid task
     page = client_fixture.get(
@@ -115,6 +142,23 @@ def test_duplicate_valid_task(client_fixture: fixture) -> None:
     assert "- Duplicated" in page.get_data(as_text=True)
 
 
+def test_duplicate_task_copies_params(client_fixture: fixture) -> None:
+    _, t_id = create_demo_task(db.session)
+    db.session.add(TaskParam(task_id=t_id, key="region", value="north", sensitive=0))
+    db.session.commit()
+
+    page = client_fixture.get(
+        url_for("task_controls_bp.duplicate_task", task_id=t_id), follow_redirects=True
+    )
+    new_id = int(page.request.path.split("/")[-2])
+    assert new_id != t_id
+
+    new_task = db.session.get(Task, new_id)
+    assert new_task.enabled is False
+    assert new_task.status_id is None
+    assert [(p.key, p.value) for p in new_task.params] == [("region", "north")]
+
+
 def test_invalid_task_status(client_fixture: fixture) -> None:
     # test invalid task
     page = client_fixture.get(url_for("task_controls_bp.task_status", task_id=99))
@@ -152,6 +196,19 @@ def test_delete_valid_task(client_fixture: fixture) -> None:
     assert b"Failed to disable task." in executor.data
 
 
+def test_delete_task_removes_children(client_fixture: fixture) -> None:
+    _, t_id = create_demo_task(db.session)
+    db.session.add(TaskParam(task_id=t_id, key="region", value="north", sensitive=0))
+    db.session.add(TaskLog(task_id=t_id, status_id=7, message="hello"))
+    db.session.commit()
+
+    client_fixture.get(url_for("task_controls_bp.delete_task", task_id=t_id))
+
+    assert db.session.get(Task, t_id) is None
+    assert TaskParam.query.filter_by(task_id=t_id).count() == 0
+    assert TaskLog.query.filter_by(task_id=t_id).count() == 0
+
+
 def test_end_retry_invalid_task(client_fixture: fixture) -> None:
     # test invalid task
     page = client_fixture.get(
@@ -197,3 +254,4 @@ def test_reset_valid_task(client_fixture: fixture) -> None:
     assert page.status_code == 200
 
     assert "Task has been reset to completed." in page.get_data(as_text=True)
+    assert db.session.get(Task, t_id).status_id == 4
@@ -38,6 +38,24 @@ def test_valid_project_new_task_get(client_fixture: fixture) -> None:
     assert page.status_code == 200
 
 
+def test_new_task_get_lists_new_connection(client_fixture: fixture) -> None:
+    p_id, _ = create_demo_task(db.session)
+    # prime the cached dropdowns
+    client_fixture.get(url_for("task_edit_bp.task_new_get", project_id=p_id))
+
+    mimetype = "application/x-www-form-urlencoded"
+    headers = {"Content-Type": mimetype, "Accept": mimetype}
+    client_fixture.post(
+        url_for("connection_bp.new_connection"),
+        data={"name": "Dropdown Connection"},
+        follow_redirects=True,
+        headers=headers,
+    )
+
+    page = client_fixture.get(url_for("task_edit_bp.task_new_get", project_id=p_id))
+    assert "Dropdown Connection" in page.get_data(as_text=True)
+
+
 def test_new_task(client_fixture: fixture) -> None:
     # get project id
     p_id, _ = create_demo_task(db.session)
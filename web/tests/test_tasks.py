@@ -16,7 +16,7 @@ from flask import request, url_for
 from pytest import fixture
 
 from web.extensions import db
-from web.model import Project, Task, TaskLog
+from web.model import Connection, ConnectionSftp, Project, Task, TaskLog
 
 from .conftest import create_demo_task
 
@@ -36,6 +36,13 @@ def test_tasks_home(client_fixture: fixture) -> None:
     page = client_fixture.get("/task", follow_redirects=False)
     assert page.status_code == 200
 
+    # owner totals are rolled up across projects
+    create_demo_task(db.session)
+    page = client_fixture.get("/task", follow_redirects=False)
+    assert page.status_code == 200
+    owner = page.get_data(as_text=True).split('href="/task/user/1"')[1].split("</a>")[0]
+    assert 'is-rounded">2</span>' in owner
+
 
 def test_my_tasks(client_fixture: fixture) -> None:
     # remove everyting
@@ -94,8 +101,37 @@ def test_one_task(client_fixture: fixture) -> None:
     page = client_fixture.get(url_for("task_bp.one_task", task_id=t_id), follow_redirects=False)
     assert page.status_code == 200
 
+    # unchanged task is not rendered again
+    etag = page.headers["ETag"]
+    page = client_fixture.get(
+        url_for("task_bp.one_task", task_id=t_id), headers={"If-None-Match": etag}
+    )
+    assert page.status_code == 304
+
+    # runner status change gives a new page
+    task = db.session.get(Task, t_id)
+    task.status_id = 2
+    db.session.commit()
+    page = client_fixture.get(
+        url_for("task_bp.one_task", task_id=t_id), headers={"If-None-Match": etag}
+    )
+    assert page.status_code == 200
+    assert page.headers["ETag"] != etag
+
+    # saving a connection gives a new page, the task shows connection details
+    etag = page.headers["ETag"]
+    conn = Connection(name="Etag Org")
+    db.session.add(conn)
+    db.session.commit()
+    client_fixture.post(f"/connection/{conn.id}/sftp/new", data={"name": "Etag SFTP"})
+    page = client_fixture.get(
+        url_for("task_bp.one_task", task_id=t_id), headers={"If-None-Match": etag}
+    )
+    assert page.status_code == 200
+    assert page.headers["ETag"] != etag
 
-def test_urls(client_fixture: fixture) -> None:
+
+def test_urls(client_fixture: fixture, assert_max_queries: fixture) -> None:
     response = client_fixture.get("/task/sftp-dest")
     assert response.status_code == 200
 
@@ -140,3 +176,32 @@ def test_urls(client_fixture: fixture) -> None:
 
     response = client_fixture.get("/task/database-source")
     assert response.status_code == 200
+
+    # connection options are listed for the requested connection
+    conn = Connection(name="Picker Org")
+    db.session.add(conn)
+    db.session.commit()
+    client_fixture.post(f"/connection/{conn.id}/sftp/new", data={"name": "Picker SFTP"})
+    sftp = ConnectionSftp.query.filter_by(connection_id=conn.id).first()
+
+    with assert_max_queries(1):
+        response = client_fixture.get(f"/task/sftp-dest?org={conn.id}")
+    assert response.status_code == 200
+    assert "Picker SFTP" in response.get_data(as_text=True)
+
+    # unchanged pickers revalidate against the etag
+    response = client_fixture.get(
+        f"/task/sftp-dest?org={conn.id}", headers={"If-None-Match": response.headers["ETag"]}
+    )
+    assert response.status_code == 304
+
+    # editing the connection refreshes the cached picker
+    client_fixture.post(
+        f"/connection/{conn.id}/sftp/{sftp.id}/edit", data={"name": "Renamed SFTP"}
+    )
+    response = client_fixture.get(f"/task/sftp-dest?org={conn.id}")
+    assert "Renamed SFTP" in response.get_data(as_text=True)
+
+    response = client_fixture.get(f"/task/ftp-dest?org={conn.id}")
+    assert response.status_code == 200
+    assert "Picker SFTP" not in response.get_data(as_text=True)
@@ -3,7 +3,7 @@
 import sys
 from pathlib import Path
 
-from .executors import submit_executor
+from .executors import http_session, submit_executor
 
 sys.path.append(str(Path(__file__).parents[2]) + "/scripts")
 from database import get_or_create, seed  # isort:skip
@@ -19,7 +19,7 @@ from werkzeug import Response
 
 from web import db
 from web.model import Task, TaskLog
-from web.web import submit_executor
+from web.web import http_session, submit_executor
 
 admin_bp = Blueprint("admin_bp", __name__)
 
@@ -63,7 +63,7 @@ def reschedule_tasks() -> Response:
     """Emtpy scheduler and re-add all enabled jobs."""
     try:
         output = json.loads(
-            requests.get(app.config["SCHEDULER_HOST"] + "/delete", timeout=60).text
+            http_session.get(app.config["SCHEDULER_HOST"] + "/delete", timeout=60).text
         )
 
         msg = output["message"]
@@ -99,7 +99,9 @@ def reset_tasks() -> Response:
 def pause_scheduler() -> Response:
     """Stop all jobs from future runs."""
     try:
-        output = json.loads(requests.get(app.config["SCHEDULER_HOST"] + "/pause", timeout=60).text)
+        output = json.loads(
+            http_session.get(app.config["SCHEDULER_HOST"] + "/pause", timeout=60).text
+        )
 
         if output.get("error"):
             msg = output["error"]
@@ -124,7 +126,7 @@ def resume_scheduler() -> Response:
     """Resume all paused jobs."""
     try:
         output = json.loads(
-            requests.get(app.config["SCHEDULER_HOST"] + "/resume", timeout=60).text
+            http_session.get(app.config["SCHEDULER_HOST"] + "/resume", timeout=60).text
         )
 
         if output.get("error"):
@@ -149,7 +151,9 @@ def resume_scheduler() -> Response:
 def kill_scheduler() -> Response:
     """Kill the scheduler."""
     try:
-        output = json.loads(requests.get(app.config["SCHEDULER_HOST"] + "/kill", timeout=60).text)
+        output = json.loads(
+            http_session.get(app.config["SCHEDULER_HOST"] + "/kill", timeout=60).text
+        )
 
         msg = output["message"]
         add_user_log(msg, 0)
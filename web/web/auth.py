@@ -21,7 +21,7 @@ auth_bp = Blueprint("auth_bp", __name__)
 @app.login_manager.user_loader
 def load_user(user_id: int) -> User:
     """Get user."""
-    return User.query.filter_by(id=user_id).first()
+    return db.session.get(User, user_id)
 
 
 @auth_bp.route("/not_authorized")
@@ -24,6 +24,9 @@ from web.model import (
     ConnectionSsh,
     TaskLog,
 )
+from web.web import http_session
+
+from .task_edit import clear_task_form_options
 
 sys.path.append(str(Path(__file__).parents[2]) + "/scripts")
 
@@ -48,7 +51,7 @@ def all_connections() -> str:
 @login_required
 def one_connection(connection_id: int) -> str:
     """Get one connection."""
-    connection = Connection.query.filter_by(id=connection_id).first()
+    connection = db.session.get(Connection, connection_id)
 
     return render_template(
         "pages/connection/one.html.j2",
@@ -61,7 +64,7 @@ def one_connection(connection_id: int) -> str:
 @login_required
 def edit_connection(connection_id: int) -> Union[str, Response]:
     """Edit a connection."""
-    connection = Connection.query.filter_by(id=connection_id).first_or_404()
+    connection = db.get_or_404(Connection, connection_id)
 
     if request.method == "GET":
         return render_template(
@@ -84,6 +87,7 @@ def edit_connection(connection_id: int) -> Union[str, Response]:
     )
 
     db.session.commit()
+    clear_task_form_options()
 
     log = TaskLog(
         status_id=7,
@@ -118,6 +122,7 @@ def new_connection() -> Union[str, Response]:
 
     db.session.add(me)
     db.session.commit()
+    clear_task_form_options()
 
     log = TaskLog(
         status_id=7,
@@ -142,6 +147,7 @@ def delete_connection(connection_id: int) -> Response:
     ConnectionDatabase.query.filter_by(connection_id=connection_id).delete()
     Connection.query.filter_by(id=connection_id).delete()
     db.session.commit()
+    clear_task_form_options()
 
     log = TaskLog(
         status_id=7,
@@ -159,6 +165,7 @@ def delete_connection_sftp(connection_id: int, sftp_id: int) -> Response:
     """Delete a SFTP connection."""
     ConnectionSftp.query.filter_by(connection_id=connection_id, id=sftp_id).delete()
     db.session.commit()
+    clear_task_form_options()
 
     log = TaskLog(
         status_id=7,
@@ -215,6 +222,7 @@ def edit_connection_sftp(connection_id: int, sftp_id: int) -> Union[Response, st
     )
 
     db.session.commit()
+    clear_task_form_options()
 
     log = TaskLog(
         status_id=7,
@@ -231,7 +239,7 @@ def edit_connection_sftp(connection_id: int, sftp_id: int) -> Union[Response, st
 @login_required
 def new_connection_sftp(connection_id: int) -> Union[str, Response]:
     """Create a SFTP connection."""
-    connection = Connection.query.filter_by(id=connection_id).first_or_404()
+    connection = db.get_or_404(Connection, connection_id)
     if request.method == "GET":
         return render_template(
             "pages/connection/sftp_edit.html.j2",
@@ -266,6 +274,7 @@ def new_connection_sftp(connection_id: int) -> Union[str, Response]:
 
     db.session.add(sftp)
     db.session.commit()
+    clear_task_form_options()
 
     log = TaskLog(
         status_id=7,
@@ -284,6 +293,7 @@ def delete_connection_ssh(connection_id: int, ssh_id: int) -> Response:
     """Delete a SSH connection."""
     ConnectionSsh.query.filter_by(connection_id=connection_id, id=ssh_id).delete()
     db.session.commit()
+    clear_task_form_options()
     log = TaskLog(
         status_id=7,
         message=f"{current_user.full_name}: SSH Connection deleted. ({ssh_id})",
@@ -298,7 +308,7 @@ def delete_connection_ssh(connection_id: int, ssh_id: int) -> Response:
 @login_required
 def new_connection_ssh(connection_id: int) -> Union[str, Response]:
     """Create a SSH connection."""
-    connection = Connection.query.filter_by(id=connection_id).first_or_404()
+    connection = db.get_or_404(Connection, connection_id)
     if request.method == "GET":
         return render_template(
             "pages/connection/ssh_edit.html.j2",
@@ -322,6 +332,7 @@ def new_connection_ssh(connection_id: int) -> Union[str, Response]:
 
     db.session.add(ssh)
     db.session.commit()
+    clear_task_form_options()
 
     log = TaskLog(
         status_id=7,
@@ -364,6 +375,7 @@ def edit_connection_ssh(connection_id: int, ssh_id: int) -> Union[Response, str]
     )
 
     db.session.commit()
+    clear_task_form_options()
     log = TaskLog(
         status_id=7,
         message=f"{current_user.full_name}: SSH Connection edited. ({ssh.id}) {ssh}",
@@ -380,6 +392,7 @@ def delete_connection_smb(connection_id: int, smb_id: int) -> Response:
     """Delete a SMB connection."""
     ConnectionSmb.query.filter_by(connection_id=connection_id, id=smb_id).delete()
     db.session.commit()
+    clear_task_form_options()
     log = TaskLog(
         status_id=7,
         message=f"{current_user.full_name}: SMB Connection deleted. ({smb_id})",
@@ -395,7 +408,7 @@ def delete_connection_smb(connection_id: int, smb_id: int) -> Response:
 @login_required
 def new_connection_smb(connection_id: int) -> Union[Response, str]:
     """Create a SMB connection."""
-    connection = Connection.query.filter_by(id=connection_id).first_or_404()
+    connection = db.get_or_404(Connection, connection_id)
     if request.method == "GET":
         return render_template(
             "pages/connection/smb_edit.html.j2",
@@ -421,6 +434,7 @@ def new_connection_smb(connection_id: int) -> Union[Response, str]:
 
     db.session.add(smb)
     db.session.commit()
+    clear_task_form_options()
 
     log = TaskLog(
         status_id=7,
@@ -465,6 +479,7 @@ def edit_connection_smb(connection_id: int, smb_id: int) -> Union[Response, str]
     )
 
     db.session.commit()
+    clear_task_form_options()
 
     log = TaskLog(
         status_id=7,
@@ -482,6 +497,7 @@ def delete_connection_ftp(connection_id: int, ftp_id: int) -> Response:
     """Delete a FPT connection."""
     ConnectionFtp.query.filter_by(connection_id=connection_id, id=ftp_id).delete()
     db.session.commit()
+    clear_task_form_options()
     log = TaskLog(
         status_id=7,
         message=f"{current_user.full_name}: FTP Connection deleted. ({ftp_id})",
@@ -497,7 +513,7 @@ def delete_connection_ftp(connection_id: int, ftp_id: int) -> Response:
 @login_required
 def new_connection_ftp(connection_id: int) -> Union[Response, str]:
     """Create a FTP connection."""
-    connection = Connection.query.filter_by(id=connection_id).first_or_404()
+    connection = db.get_or_404(Connection, connection_id)
     if request.method == "GET":
         return render_template(
             "pages/connection/ftp_edit.html.j2",
@@ -521,6 +537,7 @@ def new_connection_ftp(connection_id: int) -> Union[Response, str]:
 
     db.session.add(ftp)
     db.session.commit()
+    clear_task_form_options()
 
     log = TaskLog(
         status_id=7,
@@ -563,6 +580,7 @@ def edit_connection_ftp(connection_id: int, ftp_id: int) -> Union[Response, str]
     )
 
     db.session.commit()
+    clear_task_form_options()
 
     log = TaskLog(
         status_id=7,
@@ -581,6 +599,7 @@ def delete_connection_gpg(connection_id: int, gpg_id: int) -> Response:
     """Delete a GPG connection."""
     ConnectionGpg.query.filter_by(connection_id=connection_id, id=gpg_id).delete()
     db.session.commit()
+    clear_task_form_options()
     log = TaskLog(
         status_id=7,
         message=f"{current_user.full_name}: GPG Connection deleted. ({gpg_id})",
@@ -595,7 +614,7 @@ def delete_connection_gpg(connection_id: int, gpg_id: int) -> Response:
 @login_required
 def new_connection_gpg(connection_id: int) -> Union[Response, str]:
     """Create a GPG connection."""
-    connection = Connection.query.filter_by(id=connection_id).first_or_404()
+    connection = db.get_or_404(Connection, connection_id)
     if request.method == "GET":
         return render_template(
             "pages/connection/gpg_edit.html.j2",
@@ -616,6 +635,7 @@ def new_connection_gpg(connection_id: int) -> Union[Response, str]:
 
     db.session.add(gpg)
     db.session.commit()
+    clear_task_form_options()
 
     log = TaskLog(
         status_id=7,
@@ -655,6 +675,7 @@ def edit_connection_gpg(connection_id: int, gpg_id: int) -> Union[str, Response]
     )
 
     db.session.commit()
+    clear_task_form_options()
 
     log = TaskLog(
         status_id=7,
@@ -672,6 +693,7 @@ def delete_connection_database(connection_id: int, database_id: int) -> Response
     """Delete a database connection."""
     ConnectionDatabase.query.filter_by(connection_id=connection_id, id=database_id).delete()
     db.session.commit()
+    clear_task_form_options()
     log = TaskLog(
         status_id=7,
         message=f"{current_user.full_name}: Database Connection deleted. ({database_id})",
@@ -715,6 +737,7 @@ def edit_connection_database(connection_id: int, database_id: int) -> Union[Resp
     )
 
     db.session.commit()
+    clear_task_form_options()
 
     log = TaskLog(
         status_id=7,
@@ -731,7 +754,7 @@ def edit_connection_database(connection_id: int, database_id: int) -> Union[Resp
 @login_required
 def new_connection_database(connection_id: int) -> Union[Response, str]:
     """Create a database connection."""
-    connection = Connection.query.filter_by(id=connection_id).first_or_404()
+    connection = db.get_or_404(Connection, connection_id)
     if request.method == "GET":
         return render_template(
             "pages/connection/database_edit.html.j2",
@@ -754,6 +777,7 @@ def new_connection_database(connection_id: int) -> Union[Response, str]:
 
     db.session.add(database)
     db.session.commit()
+    clear_task_form_options()
 
     log = TaskLog(
         status_id=7,
@@ -770,8 +794,10 @@ def new_connection_database(connection_id: int) -> Union[Response, str]:
 def ssh_online(ssh_id: int) -> str:
     """Check if connection is online."""
     try:
-        return requests.get(f"{app.config['RUNNER_HOST']}/ssh/{ssh_id}/status", timeout=60).text
-    except BaseException as e:
+        return http_session.get(
+            f"{app.config['RUNNER_HOST']}/ssh/{ssh_id}/status", timeout=60
+        ).text
+    except requests.RequestException as e:
         return f'<span class="has-tooltip-arrow has-tooltip-right has-tooltip-multiline tag is-danger is-light" data-tooltip="{e}">Offline</span>'
 
 
@@ -780,10 +806,10 @@ def ssh_online(ssh_id: int) -> str:
 def database_online(database_id: int) -> str:
     """Check if connection is online."""
     try:
-        return requests.get(
+        return http_session.get(
             f"{app.config['RUNNER_HOST']}/database/{database_id}/status", timeout=60
         ).text
-    except BaseException as e:
+    except requests.RequestException as e:
         return f'<span class="has-tooltip-arrow has-tooltip-right has-tooltip-multiline tag is-danger is-light" data-tooltip="{e}">Offline</span>'
 
 
@@ -792,8 +818,10 @@ def database_online(database_id: int) -> str:
 def sftp_online(sftp_id: int) -> str:
     """Check if connection is online."""
     try:
-        return requests.get(f"{app.config['RUNNER_HOST']}/sftp/{sftp_id}/status", timeout=60).text
-    except BaseException as e:
+        return http_session.get(
+            f"{app.config['RUNNER_HOST']}/sftp/{sftp_id}/status", timeout=60
+        ).text
+    except requests.RequestException as e:
         return f'<span class="has-tooltip-arrow has-tooltip-right has-tooltip-multiline tag is-danger is-light" data-tooltip="{e}">Offline</span>'
 
 
@@ -802,8 +830,10 @@ def sftp_online(sftp_id: int) -> str:
 def ftp_online(ftp_id: int) -> str:
     """Check if connection is online."""
     try:
-        return requests.get(f"{app.config['RUNNER_HOST']}/ftp/{ftp_id}/status", timeout=60).text
-    except BaseException as e:
+        return http_session.get(
+            f"{app.config['RUNNER_HOST']}/ftp/{ftp_id}/status", timeout=60
+        ).text
+    except requests.RequestException as e:
         return f'<span class="has-tooltip-arrow has-tooltip-right has-tooltip-multiline tag is-danger is-light" data-tooltip="{e}">Offline</span>'
 
 
@@ -812,6 +842,8 @@ def ftp_online(ftp_id: int) -> str:
 def smb_online(smb_id: int) -> str:
     """Check if connection is online."""
     try:
-        return requests.get(f"{app.config['RUNNER_HOST']}/smb/{smb_id}/status", timeout=60).text
-    except BaseException as e:
+        return http_session.get(
+            f"{app.config['RUNNER_HOST']}/smb/{smb_id}/status", timeout=60
+        ).text
+    except requests.RequestException as e:
         return f'<span class="has-tooltip-arrow has-tooltip-right has-tooltip-multiline tag is-danger is-light" data-tooltip="{e}">Offline</span>'
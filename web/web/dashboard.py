@@ -25,7 +25,7 @@ from web.model import (
     TaskLog,
     User,
 )
-from web.web import submit_executor
+from web.web import http_session, submit_executor
 
 dashboard_bp = Blueprint("dashboard_bp", __name__)
 
@@ -188,7 +188,7 @@ def active_schedule() -> str:
     """Graph showing current run schedule for next 12 hrs."""
     try:
         schedule = json.loads(
-            requests.get(app.config["SCHEDULER_HOST"] + "/schedule", timeout=60).text
+            http_session.get(app.config["SCHEDULER_HOST"] + "/schedule", timeout=60).text
         )
 
         max_index = max(map(lambda x: x.get("count"), schedule))
@@ -220,7 +220,7 @@ def dash_orphans_delete() -> Response:
     """Button to delete any jobs without a linked tasks."""
     try:
         output = json.loads(
-            requests.get(app.config["SCHEDULER_HOST"] + "/delete-orphans", timeout=60).text,
+            http_session.get(app.config["SCHEDULER_HOST"] + "/delete-orphans", timeout=60).text,
         )
         msg = output["message"]
         add_user_log(msg, 0)
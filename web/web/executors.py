@@ -14,17 +14,26 @@ from flask import Blueprint
 from flask import current_app as app
 from flask import jsonify
 from flask_login import current_user, login_required
+from requests.adapters import HTTPAdapter
 from sqlalchemy import and_, or_
 from werkzeug.wrappers import Response
 
 from web import db, executor, redis_client
-from web.model import Project, Task, TaskLog
+from web.model import TASK_LIST_OPTIONS, Project, Task, TaskLog
 
 sys.path.append(str(Path(__file__).parents[2]) + "/scripts")
 from error_print import full_stack
 
 executors_bp = Blueprint("executors_bp", __name__)
 
+# reuse keep-alive connections to the scheduler and runner across requests
+# and executor threads instead of opening a new connection for every call.
+# no retries: several of the endpoints (run, add, delete) are not safe to
+# send twice.
+http_session = requests.Session()
+http_session.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+http_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
 
 @executors_bp.route("/executor/status")
 @login_required
@@ -83,7 +92,7 @@ def executor_finished(name: str, future: Future) -> None:
 def send_task_to_scheduler(task_id: int) -> None:
     """Silently send task or raise an error."""
     try:
-        requests.get(app.config["SCHEDULER_HOST"] + "/add/" + str(task_id), timeout=60)
+        http_session.get(app.config["SCHEDULER_HOST"] + "/add/" + str(task_id), timeout=60)
         log = TaskLog(
             task_id=task_id,
             status_id=7,
@@ -95,7 +104,7 @@ def send_task_to_scheduler(task_id: int) -> None:
     # pylint: disable=broad-except
     except (requests.exceptions.ConnectionError, urllib3.exceptions.NewConnectionError):
         # set task to disabled.
-        Task.query.filter_by(id=task_id).first().enabled = 0
+        db.session.get(Task, task_id).enabled = False
         db.session.commit()
 
         log = TaskLog(
@@ -103,10 +112,8 @@ def send_task_to_scheduler(task_id: int) -> None:
             error=1,
             task_id=task_id,
             message=(
-                (current_user.full_name or "none")
-                + ": Failed to schedule task. ("
-                + str(task_id)
-                + ")\nScheduler is offline."
+                f"{current_user.full_name or 'none'}: Failed to schedule task. ({task_id})\n"
+                "Scheduler is offline."
             ),
         )
         db.session.add(log)
@@ -124,7 +131,8 @@ def send_task_to_runner(task: Task) -> None:
             first_sequence = (
                 db.session.execute(
                     db.select(Task)
-                    .filter_by(project_id=task.project_id, enabled=1)
+                    .options(*TASK_LIST_OPTIONS)
+                    .filter_by(project_id=task.project_id, enabled=True)
                     .order_by(Task.order.asc())
                     .limit(1)
                 )
@@ -133,7 +141,7 @@ def send_task_to_runner(task: Task) -> None:
                 .order
             )
             if first_sequence is not None and task.order == first_sequence:
-                requests.get(app.config["SCHEDULER_HOST"] + "/run/" + str(task.id), timeout=60)
+                http_session.get(app.config["SCHEDULER_HOST"] + "/run/" + str(task.id), timeout=60)
 
                 log = TaskLog(
                     task_id=task.id,
@@ -154,7 +162,7 @@ def send_task_to_runner(task: Task) -> None:
                 db.session.commit()
                 raise ValueError("Task was not scheduled. It is not the first sequence task.")
         else:
-            requests.get(app.config["SCHEDULER_HOST"] + "/run/" + str(task.id), timeout=60)
+            http_session.get(app.config["SCHEDULER_HOST"] + "/run/" + str(task.id), timeout=60)
 
     except (requests.exceptions.ConnectionError, urllib3.exceptions.NewConnectionError):
         logging.error({"empty_msg": "Error - Scheduler offline."})
@@ -180,7 +188,8 @@ def sub_enable_task(task: Task) -> None:
         first_sequence = (
             db.session.execute(
                 db.select(Task)
-                .filter_by(project_id=task.project_id, enabled=1)
+                .options(*TASK_LIST_OPTIONS)
+                .filter_by(project_id=task.project_id, enabled=True)
                 .order_by(Task.order.asc())
                 .limit(1)
             )
@@ -192,12 +201,12 @@ def sub_enable_task(task: Task) -> None:
             send_task_to_scheduler(task_id=task.id)
         else:
             # make sure it is not in the scheduler.
-            requests.get(app.config["SCHEDULER_HOST"] + "/delete/" + str(task.id), timeout=60)
+            http_session.get(app.config["SCHEDULER_HOST"] + "/delete/" + str(task.id), timeout=60)
     else:
         send_task_to_scheduler(task.id)
 
     # show as enabled only if we made it to scheduler
-    task.enabled = 1
+    task.enabled = True
     db.session.commit()
 
     log = TaskLog(
@@ -214,15 +223,15 @@ def enable_task(task_list: List[int]) -> str:
     task_id: int = task_list[0]
 
     # if task is part of a sequence then reschedule the full project.
-    task = Task.query.filter_by(id=task_id).first()
-    task.enabled = 1
+    task = db.session.get(Task, task_id)
+    task.enabled = True
     db.session.commit()
 
     if task.project and task.project.sequence_tasks == 1:
         # reschedule all tasks in project
-        tasks = Task.query.filter(
+        tasks = Task.query.options(*TASK_LIST_OPTIONS).filter(
             or_(  # type: ignore[type-var]
-                and_(Task.project_id == task.project_id, Task.enabled == 1),
+                and_(Task.project_id == task.project_id, Task.enabled.is_(True)),
                 Task.id == task_id,
             )
         )
@@ -255,7 +264,10 @@ def run_project(project_list: List[int]) -> str:
 
     tasks = (
         db.session.execute(
-            db.select(Task).filter_by(project_id=project_id, enabled=1).order_by(Task.order.asc())
+            db.select(Task)
+            .options(*TASK_LIST_OPTIONS)
+            .filter_by(project_id=project_id, enabled=True)
+            .order_by(Task.order.asc())
         )
         .scalars()
         .all()
@@ -297,7 +309,7 @@ def run_project(project_list: List[int]) -> str:
 def disable_project(project_list: List[int]) -> str:
     """Disabling project."""
     project_id = project_list[0]
-    tasks = Task.query.filter_by(project_id=project_id).all()
+    tasks = Task.query.options(*TASK_LIST_OPTIONS).filter_by(project_id=project_id).all()
 
     try:
         for task in tasks:
@@ -317,11 +329,7 @@ def disable_project(project_list: List[int]) -> str:
             status_id=7,
             error=1,
             message=(
-                (current_user.full_name or "none")
-                + ": Failed to disable task. ("
-                + str(task.id)
-                + ")\n"
-                + str(e)
+                f"{current_user.full_name or 'none'}: Failed to disable task. ({task.id})\n{e}"
             ),
         )
         db.session.add(log)
@@ -334,11 +342,13 @@ def disable_project(project_list: List[int]) -> str:
 def schedule_project(project_list: List[int]) -> str:
     """Scheduling project."""
     project_id = project_list[0]
-    tasks = Task.query.filter_by(project_id=project_id, enabled=1).all()
+    tasks = (
+        Task.query.options(*TASK_LIST_OPTIONS).filter_by(project_id=project_id, enabled=True).all()
+    )
     try:
         # first enable all, so we get sequence right
         for task in tasks:
-            task.enabled = 1
+            task.enabled = True
             db.session.commit()
 
         for task in tasks:
@@ -346,12 +356,12 @@ def schedule_project(project_list: List[int]) -> str:
 
     # pylint: disable=broad-except
     except BaseException as e:
-        task.enabled = 0
+        task.enabled = False
         db.session.commit()
         log = TaskLog(
             status_id=7,
             error=1,
-            message=((current_user.full_name or "none") + ": Failed to schedule task.\n" + str(e)),
+            message=f"{current_user.full_name or 'none'}: Failed to schedule task.\n{e}",
         )
         db.session.add(log)
         db.session.commit()
@@ -363,12 +373,12 @@ def schedule_project(project_list: List[int]) -> str:
 def enable_project(project_list: List[int]) -> str:
     """Enabling project."""
     project_id = project_list[0]
-    tasks = Task.query.filter_by(project_id=project_id).all()
+    tasks = Task.query.options(*TASK_LIST_OPTIONS).filter_by(project_id=project_id).all()
 
     try:
         # first enable all, so we get sequence right
         for task in tasks:
-            task.enabled = 1
+            task.enabled = True
             db.session.commit()
 
         for task in tasks:
@@ -376,14 +386,12 @@ def enable_project(project_list: List[int]) -> str:
 
     # pylint: disable=broad-except
     except BaseException as e:
-        task.enabled = 0
+        task.enabled = False
         db.session.commit()
         log = TaskLog(
             status_id=7,
             error=1,
-            message=(
-                (current_user.full_name or "none") + ": Failed to enable project.\n" + str(e)
-            ),
+            message=f"{current_user.full_name or 'none'}: Failed to enable project.\n{e}",
         )
         db.session.add(log)
         db.session.commit()
@@ -395,13 +403,13 @@ def enable_project(project_list: List[int]) -> str:
 def sub_disable_task(task_id: int) -> None:
     """Shared function for disabling a task."""
     try:
-        requests.get(app.config["SCHEDULER_HOST"] + "/delete/" + str(task_id), timeout=60)
+        http_session.get(app.config["SCHEDULER_HOST"] + "/delete/" + str(task_id), timeout=60)
 
         # also clear retry counter
         redis_client.delete(f"runner_{task_id}_attempt")
 
-        task = Task.query.filter_by(id=task_id).first()
-        task.enabled = 0
+        task = db.session.get(Task, task_id)
+        task.enabled = False
         task.next_run = None
         db.session.commit()
     except BaseException as e:
@@ -415,7 +423,7 @@ def disable_task(task_list: List[int]) -> str:
     try:
         sub_disable_task(task_id)
 
-        task = Task.query.filter_by(id=task_id).first()
+        task = db.session.get(Task, task_id)
         log = TaskLog(
             task_id=task_id,
             status_id=7,
@@ -426,7 +434,11 @@ def disable_task(task_list: List[int]) -> str:
 
         if task.project and task.project.sequence_tasks == 1:
             # update sequence
-            for task in Task.query.filter_by(project_id=task.project_id, enabled=1).all():
+            for task in (
+                Task.query.options(*TASK_LIST_OPTIONS)
+                .filter_by(project_id=task.project_id, enabled=True)
+                .all()
+            ):
                 sub_enable_task(task)
             return "Task disabled, sequence updated."
 
@@ -439,11 +451,7 @@ def disable_task(task_list: List[int]) -> str:
             status_id=7,
             error=1,
             message=(
-                (current_user.full_name or "none")
-                + ": Failed to disable task. ("
-                + str(task_id)
-                + ")\n"
-                + str(e)
+                f"{current_user.full_name or 'none'}: Failed to disable task. ({task_id})\n{e}"
             ),
         )
         db.session.add(log)
@@ -455,7 +463,7 @@ def disable_task(task_list: List[int]) -> str:
 def schedule_enabled_tasks(*args: Any) -> str:
     """Sending enabled tasks to scheduler."""
     try:
-        for task in Task.query.filter_by(enabled=1).all():
+        for task in Task.query.options(*TASK_LIST_OPTIONS).filter_by(enabled=True).all():
             sub_enable_task(task)
 
         return "Tasks sent to scheduler."
@@ -467,7 +475,7 @@ def schedule_enabled_tasks(*args: Any) -> str:
 # pylint: disable=W0613
 def run_scheduled_tasks(*args: Any) -> None:
     """Running all scheduled tasks."""  # noqa: D401
-    tasks = Task.query.filter(enabled=1).all()
+    tasks = Task.query.options(*TASK_LIST_OPTIONS).filter_by(enabled=True).all()
 
     for task in tasks:
         send_task_to_runner(task)
@@ -479,12 +487,12 @@ def disabled_scheduled_tasks(*args: Any) -> str:
     # Basically dump the scheduler and set all tasks to disabled.
 
     try:
-        requests.get(app.config["SCHEDULER_HOST"] + "/delete", timeout=60)
+        http_session.get(app.config["SCHEDULER_HOST"] + "/delete", timeout=60)
 
-        tasks = Task.query.filter_by(enabled=1).all()
+        tasks = Task.query.options(*TASK_LIST_OPTIONS).filter_by(enabled=True).all()
 
         for task in tasks:
-            task.enabled = 0
+            task.enabled = False
             db.session.commit()
 
             log = TaskLog(
@@ -504,7 +512,7 @@ def disabled_scheduled_tasks(*args: Any) -> str:
 # pylint: disable=W0613
 def run_errored_tasks(*args: Any) -> str:
     """Running all errored tasks."""  # noqa: D401
-    tasks = Task.query.filter_by(status_id=2, enabled=1).all()
+    tasks = Task.query.options(*TASK_LIST_OPTIONS).filter_by(status_id=2, enabled=True).all()
 
     try:
         for task in tasks:
@@ -519,7 +527,7 @@ def refresh_cache(task_list: List[int]) -> str:
     """Refreshing task cache."""
     task_id: int = task_list[0]
     try:
-        return requests.get(
+        return http_session.get(
             f"{app.config['RUNNER_HOST']}/task/{task_id}/refresh_cache", timeout=60
         ).text
 
@@ -54,7 +54,7 @@ def all_projects() -> Union[Response, str]:
 def user_projects(user_id: int) -> Union[Response, str]:
     """List projects for a specific user."""
     user_id = user_id or current_user.id
-    my_user = User.query.filter_by(id=user_id).first()
+    my_user = db.session.get(User, user_id)
     if not my_user:
         flash("That user doesn't exist.")
         return redirect(url_for("project_bp.all_projects"))
@@ -87,26 +87,26 @@ def user_projects(user_id: int) -> Union[Response, str]:
 @login_required
 def one_project(project_id: int) -> Union[str, Response]:
     """Project detail page."""
-    me = Project.query.filter_by(id=project_id).first()
+    me = db.session.get(Project, project_id)
 
     if me:
         first_task = (
             Task.query.filter_by(project_id=project_id)
-            .filter_by(enabled=1)
+            .filter_by(enabled=True)
             .order_by(Task.order.asc(), Task.name.asc())  # type: ignore[attr-defined, union-attr]
             .first()
         )
         try:
-            desc = ExpressionDescriptor(
-                cron_year=me.cron_year,
-                cron_month=me.cron_month,
-                cron_week=me.cron_week,
-                cron_day=me.cron_day,
-                cron_week_day=me.cron_week_day,
-                cron_hour=me.cron_hour,
-                cron_min=me.cron_min,
-                cron_sec=me.cron_sec,
-            ).get_full_description()
+            desc = ExpressionDescriptor.describe(
+                me.cron_year,
+                me.cron_month,
+                me.cron_week,
+                me.cron_day,
+                me.cron_week_day,
+                me.cron_hour,
+                me.cron_min,
+                me.cron_sec,
+            )
         except ValueError as e:
             desc = e
 
@@ -127,7 +127,7 @@ def one_project(project_id: int) -> Union[str, Response]:
 @login_required
 def edit_project_form(project_id: int) -> Union[str, Response]:
     """Project editor page."""
-    me = Project.query.filter_by(id=project_id).first()
+    me = db.session.get(Project, project_id)
 
     if me:
         return render_template("pages/project/new.html.j2", p=me, title="Editing " + me.name)
@@ -146,7 +146,7 @@ def edit_project(project_id: int) -> Union[str, Response]:
 
     # get filter query for update
     me = Project.query.filter_by(id=project.id)
-    me2 = Project.query.filter_by(id=project_id).first()
+    me2 = db.session.get(Project, project_id)
     form = request.form
     cron = form.get("project_cron", 0, type=int)
     cron_year = form.get("project_cron_year", None, type=str)
@@ -251,7 +251,7 @@ def new_project_form() -> str:
     """Create a new project page."""
     return render_template(
         "pages/project/new.html.j2",
-        p=Project.query.filter_by(id=0).first(),
+        p=None,
         title="New Project",
     )
 
@@ -291,7 +291,7 @@ def new_project() -> Union[str, Response]:
             error = str(e)
             return render_template(
                 "pages/project/new.html.j2",
-                p=Project.query.filter_by(id=0).first(),
+                p=None,
                 title="New Project",
                 error=error,
             )
@@ -418,7 +418,7 @@ def disable_all_project_tasks(project_id: int) -> Response:
 @login_required
 def duplicate_project(project_id: int) -> Response:
     """Duplicate a project."""
-    my_project = Project.query.filter_by(id=project_id).first()
+    my_project = db.session.get(Project, project_id)
     # pylint: disable=R1702
     if my_project:
         my_project_copy = Project()
@@ -464,7 +464,7 @@ def duplicate_project(project_id: int) -> Response:
                     ]:
                         setattr(new_task, key, getattr(my_task, key))
 
-                new_task.enabled = 0
+                new_task.enabled = False
                 new_task.creator_id = current_user.id
                 new_task.updater_id = current_user.id
                 new_task.status_id = None
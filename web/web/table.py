@@ -13,6 +13,7 @@ All tables accept request parameters of:
 import datetime
 import html
 import json
+from typing import Any, Dict, List
 
 import requests
 import urllib3
@@ -21,7 +22,8 @@ from flask import current_app as app
 from flask import jsonify, request
 from flask_login import current_user, login_required
 from RelativeToNow import relative_to_now
-from sqlalchemy import and_, text
+from sqlalchemy import and_, asc, desc, func, text
+from sqlalchemy.sql.elements import UnaryExpression
 from werkzeug import Response
 
 from web import db
@@ -40,10 +42,25 @@ from web.model import (
     TaskStatus,
     User,
 )
+from web.web import http_session
 
 table_bp = Blueprint("table_bp", __name__)
 
 
+def _format_date(value: Any, date_format: str, empty: str) -> Any:
+    """Format a date cell; other values pass through and empty ones become `empty`."""
+    if isinstance(value, datetime.datetime):
+        return value.strftime(date_format)
+    return value or empty
+
+
+def _sort_order(cols: Dict[str, Any], split_sort: List[str]) -> UnaryExpression:
+    """Order by a table column from a "<column>.<asc|desc>" sort argument."""
+    # only the column names and the two directions are allowed into the sql.
+    column = cols[split_sort[0]]
+    return desc(column) if split_sort[-1] == "desc" else asc(column)
+
+
 @table_bp.route("/table/project/<my_type>")
 @login_required
 def project_list(my_type: str = "all") -> Response:
@@ -60,10 +77,10 @@ def project_list(my_type: str = "all") -> Response:
         "Last Run": text("max(task.last_run)"),
         "Next Run": text("max(task.next_run)"),
         "Tasks": text("count(*)"),
-        "Enabled Tasks": text("sum(case when task.enabled = 1 then 1 else 0 end )"),
+        "Enabled Tasks": text("sum(case when task.enabled then 1 else 0 end)"),
         "Running Tasks": text("sum(case when task.status_id = 1 then 1 else 0 end)"),
         "Errored Tasks": text(
-            "sum(case when task.status_id = 2 and task.enabled = 1 then 1 else 0 end)"
+            "sum(case when task.status_id = 2 and task.enabled then 1 else 0 end)"
         ),
     }
 
@@ -80,7 +97,7 @@ def project_list(my_type: str = "all") -> Response:
         .outerjoin(Task, Task.project_id == Project.id)
         .outerjoin(User, User.id == Project.owner_id)
         .add_columns(*cols.values())
-        .order_by(text(str(cols[split_sort[0]]) + " " + split_sort[1]))
+        .order_by(_sort_order(cols, split_sort))
         .group_by(*groups.values())
     )
 
@@ -117,11 +134,7 @@ def project_list(my_type: str = "all") -> Response:
             {
                 "Name": f'{status_icon}<a  href="/project/{proj["Project Id"]}">{proj["Name"]}</a>',
                 "Last Run": relative_to_now(proj["Last Run"]) if proj["Last Run"] else "",
-                "Next Run": (
-                    datetime.datetime.strftime(proj["Next Run"], " %m/%-d/%y %H:%M")
-                    if proj["Next Run"] and isinstance(proj["Next Run"], datetime.datetime)
-                    else (proj["Next Run"] if proj["Next Run"] else "None")
-                ),
+                "Next Run": _format_date(proj["Next Run"], " %m/%-d/%y %H:%M", "None"),
                 "Tasks": str((proj["Tasks"] or 0)),
             }
         )
@@ -158,7 +171,7 @@ def tasklog_userevents() -> Response:
         .outerjoin(TaskStatus, TaskStatus.id == TaskLog.status_id)
         .filter(TaskLog.status_id == 7)
         .add_columns(*cols.values())
-        .order_by(text(str(cols[split_sort[0]]) + " " + split_sort[1]))
+        .order_by(_sort_order(cols, split_sort))
     )
 
     me = [{"head": '["Task Name", "Run Id", "Status Date", "Message"]'}]
@@ -190,13 +203,8 @@ def tasklog_userevents() -> Response:
                     if log["Job Id"]
                     else ""
                 ),
-                "Status Date": (
-                    datetime.datetime.strftime(
-                        log["Status Date"],
-                        "%a, %b %-d, %Y %H:%M:%S.%f",
-                    )
-                    if log["Status Date"] and isinstance(log["Status Date"], datetime.datetime)
-                    else (log["Status Date"] if log["Status Date"] else "None")
+                "Status Date": _format_date(
+                    log["Status Date"], "%a, %b %-d, %Y %H:%M:%S.%f", "None"
                 ),
                 "Message": log["Message"],
                 "class": "error" if log["Status Id"] == 2 or log["Error"] == 1 else "",
@@ -228,7 +236,7 @@ def user_auth() -> Response:
         .select_from(Login)
         .join(LoginType, LoginType.id == Login.type_id)
         .add_columns(*cols.values())
-        .order_by(text(str(cols[split_sort[0]]) + " " + split_sort[1]))
+        .order_by(_sort_order(cols, split_sort))
     )
 
     me = [{"head": '["User", "Login Date", "Action"]'}]
@@ -245,13 +253,8 @@ def user_auth() -> Response:
         me.append(
             {
                 "User": log["User"],
-                "Login Date": (
-                    datetime.datetime.strftime(
-                        log["Login Date"],
-                        "%a, %b %-d, %Y %H:%M:%S.%f",
-                    )
-                    if log["Login Date"] and isinstance(log["Login Date"], datetime.datetime)
-                    else (log["Login Date"] if log["Login Date"] else "None")
+                "Login Date": _format_date(
+                    log["Login Date"], "%a, %b %-d, %Y %H:%M:%S.%f", "None"
                 ),
                 "Action": log["Login Type"] if log["Login Type"] else "None",
                 "class": "error" if log["Login Type Id"] == 3 else "",
@@ -296,7 +299,7 @@ def connection_tasks(connection_id: int) -> Response:
         .select_from(Task)
         .join(ConnectionSftp, ConnectionSftp.id == Task.destination_sftp_id)
         .filter(ConnectionSftp.connection_id == connection_id)
-        .filter(Task.destination_sftp == 1)  # enabled
+        .filter(Task.destination_sftp.is_(True))  # enabled
         .add_columns(Task.id, ConnectionSftp.name)
     )
     q_sftp = (
@@ -330,7 +333,7 @@ def connection_tasks(connection_id: int) -> Response:
         .select_from(Task)
         .join(ConnectionFtp, ConnectionFtp.id == Task.destination_ftp_id)
         .filter(ConnectionFtp.connection_id == connection_id)
-        .filter(Task.destination_ftp == 1)  # enabled
+        .filter(Task.destination_ftp.is_(True))  # enabled
         .add_columns(Task.id, ConnectionFtp.name)
     )
     q_ftp = (
@@ -355,7 +358,7 @@ def connection_tasks(connection_id: int) -> Response:
         .select_from(Task)
         .join(ConnectionSmb, ConnectionSmb.id == Task.destination_smb_id)
         .filter(ConnectionSmb.connection_id == connection_id)
-        .filter(Task.destination_smb == 1)  # enabled
+        .filter(Task.destination_smb.is_(True))  # enabled
         .add_columns(Task.id, ConnectionSmb.name)
     )
     q_smb = (
@@ -387,7 +390,7 @@ def connection_tasks(connection_id: int) -> Response:
         .outerjoin(Project, Project.id == Task.project_id)
         .outerjoin(TaskStatus, TaskStatus.id == Task.status_id)
         .add_columns(*cols.values())
-        .order_by(text(str(cols[split_sort[0]]) + " " + split_sort[1]))
+        .order_by(_sort_order(cols, split_sort))
     )
 
     me = [
@@ -429,18 +432,10 @@ def connection_tasks(connection_id: int) -> Response:
                     if task["Enabled"] == 1
                     else "<a  href=/task/" + str(task["Task Id"]) + "/enable>Enable</a>"
                 ),
-                "Last Run": (
-                    datetime.datetime.strftime(task["Last Run"], "%a, %b %-d, %Y %H:%M:%S")
-                    if task["Last Run"] and isinstance(task["Last Run"], datetime.datetime)
-                    else (task["Last Run"] if task["Last Run"] else "Never")
-                ),
+                "Last Run": _format_date(task["Last Run"], "%a, %b %-d, %Y %H:%M:%S", "Never"),
                 "Run Now": "<a  href='/task/" + str(task["Task Id"]) + "/run'>Run Now</a>",
                 "Status": task["Status"] if task["Status"] else "None",
-                "Next Run": (
-                    datetime.datetime.strftime(task["Next Run"], "%a, %b %-d, %Y %H:%M:%S")
-                    if task["Next Run"] and isinstance(task["Next Run"], datetime.datetime)
-                    else (task["Next Run"] if task["Next Run"] else "None")
-                ),
+                "Next Run": _format_date(task["Next Run"], "%a, %b %-d, %Y %H:%M:%S", "None"),
                 "class": (
                     "error"
                     if task["Status Id"] == 2 or (not task["Next Run"] and task["Enabled"] == 1)
@@ -472,7 +467,7 @@ def table_jobs_orphans() -> Response:
 
     try:
         for job in json.loads(
-            requests.get(app.config["SCHEDULER_HOST"] + "/details", timeout=60).text
+            http_session.get(app.config["SCHEDULER_HOST"] + "/details", timeout=60).text
         ):
             if int(job["id"]) not in active_tasks:
                 table.append(
@@ -539,20 +534,20 @@ def dash_tasks(task_type: str) -> Response:
         .outerjoin(Project, Project.id == Task.project_id)
         .outerjoin(User, User.id == Project.owner_id)
         .add_columns(*cols.values())
-        .order_by(text(str(cols[split_sort[0]]) + " " + split_sort[1]))
+        .order_by(_sort_order(cols, split_sort))
     )
 
     me = [{"head": '["Name", "Owner", "Last Run", "Next Run", "Actions"]'}]
 
     if task_type == "errored":
-        tasks = tasks.filter(Task.status_id == 2, Task.enabled == 1)
+        tasks = tasks.filter(Task.status_id == 2, Task.enabled.is_(True))
 
     elif task_type == "scheduled":
         try:
             ids = json.loads(
-                requests.get(app.config["SCHEDULER_HOST"] + "/scheduled", timeout=60).text
+                http_session.get(app.config["SCHEDULER_HOST"] + "/scheduled", timeout=60).text
             )
-            tasks = tasks.filter(and_(Task.id.in_(ids), Task.enabled == 1))  # type: ignore[attr-defined, union-attr]
+            tasks = tasks.filter(and_(Task.id.in_(ids), Task.enabled.is_(True)))  # type: ignore[attr-defined, union-attr]
         except (
             requests.exceptions.ConnectionError,
             urllib3.exceptions.NewConnectionError,
@@ -563,7 +558,7 @@ def dash_tasks(task_type: str) -> Response:
     elif task_type == "active":
         try:
             tasks = tasks.filter(Task.status_id == 1).filter(
-                Task.enabled == 1
+                Task.enabled.is_(True)
             )  # running and enabled
         except (
             requests.exceptions.ConnectionError,
@@ -616,11 +611,7 @@ def dash_tasks(task_type: str) -> Response:
                 ),
                 "Last Run": relative_to_now(task["Last Run"]) if task["Last Run"] else "Never",
                 "Started": relative_to_now(task["Last Run"]) if task["Last Run"] else "Never",
-                "Next Run": (
-                    datetime.datetime.strftime(task["Next Run"], "%m/%-d/%y %H:%M")
-                    if task["Next Run"] and isinstance(task["Next Run"], datetime.datetime)
-                    else (task["Next Run"] if task["Next Run"] else "None")
-                ),
+                "Next Run": _format_date(task["Next Run"], "%m/%-d/%y %H:%M", "None"),
                 "Actions": (
                     (
                         "<a  href='/task/"
@@ -670,7 +661,7 @@ def task_list(my_type: str) -> Response:
             .outerjoin(User, User.id == Project.owner_id)
             .outerjoin(TaskStatus, TaskStatus.id == Task.status_id)
             .add_columns(*cols.values())
-            .order_by(text(str(cols[split_sort[0]]) + " " + split_sort[1]))
+            .order_by(_sort_order(cols, split_sort))
         )
 
     elif my_type.isdigit():
@@ -682,7 +673,7 @@ def task_list(my_type: str) -> Response:
             .outerjoin(TaskStatus, TaskStatus.id == Task.status_id)
             .filter(User.id == int(my_type))
             .add_columns(*cols.values())
-            .order_by(text(str(cols[split_sort[0]]) + " " + split_sort[1]))
+            .order_by(_sort_order(cols, split_sort))
         )
 
     else:
@@ -694,7 +685,7 @@ def task_list(my_type: str) -> Response:
             .outerjoin(TaskStatus, TaskStatus.id == Task.status_id)
             .filter(User.id == current_user.id)
             .add_columns(*cols.values())
-            .order_by(text(str(cols[split_sort[0]]) + " " + split_sort[1]))
+            .order_by(_sort_order(cols, split_sort))
         )
 
     if my_type == "all":
@@ -729,11 +720,7 @@ def task_list(my_type: str) -> Response:
         data = {
             "Name": f'<div class="field has-addons">{enabled}{status_icon}<a  href="/task/{task["Task Id"]}">{task["Name"]}</a></div>',
             "Last Run": relative_to_now(task["Last Run"]) if task["Last Run"] else "",
-            "Next Run": (
-                datetime.datetime.strftime(task["Next Run"], "%m/%-d/%y %H:%M")
-                if task["Next Run"] and isinstance(task["Next Run"], datetime.datetime)
-                else (task["Next Run"] if task["Next Run"] else "")
-            ),
+            "Next Run": _format_date(task["Next Run"], "%m/%-d/%y %H:%M", ""),
         }
 
         if my_type == "all":
@@ -769,7 +756,7 @@ def project_all_tasks(project_id: int) -> Response:
     me = [{"head": '["Name","Last Run","Run Now","Next Run"]'}]
 
     # if the task run in series then add a rank column
-    project = Project.query.filter_by(id=project_id).first()
+    project = db.session.get(Project, project_id)
     if project.sequence_tasks == 1:
         cols["Run Rank"] = text("task.order")
         me = [{"head": '["Name","Last Run","Run Now","Next Run","Run Rank"]'}]
@@ -786,9 +773,7 @@ def project_all_tasks(project_id: int) -> Response:
         .outerjoin(TaskStatus, TaskStatus.id == Task.status_id)
         .filter(Task.project_id == project_id)
         .add_columns(*cols.values())
-        .order_by(
-            Task.order.asc(), Task.name.asc(), text(str(cols[split_sort[0]]) + " " + split_sort[1])
-        )
+        .order_by(Task.order.asc(), Task.name.asc(), _sort_order(cols, split_sort))
     )
 
     me.append({"total": str(tasks.count() or 0)})  # runs.total
@@ -821,11 +806,7 @@ def project_all_tasks(project_id: int) -> Response:
                 "Name": f'<div class="field has-addons">{enabled}{status_icon}<a  href="/task/{task["Task Id"]}">{task["Name"]}</a></div>',
                 "Last Run": relative_to_now(task["Last Run"]) if task["Last Run"] else "",
                 "Run Now": "<a href='/task/" + str(task["Task Id"]) + "/run'>Run Now</a>",
-                "Next Run": (
-                    datetime.datetime.strftime(task["Next Run"], "%m/%-d/%y %H:%M")
-                    if task["Next Run"] and isinstance(task["Next Run"], datetime.datetime)
-                    else (task["Next Run"] if task["Next Run"] else "")
-                ),
+                "Next Run": _format_date(task["Next Run"], "%m/%-d/%y %H:%M", ""),
                 "Run Rank": task.get("Run Rank", None),
             }
         )
@@ -837,56 +818,45 @@ def project_all_tasks(project_id: int) -> Response:
 @login_required
 def task_log(task_id: int) -> Response:
     """Build tasklog json dataset for ajax tables."""
-    cols = {
-        "log_id": text("task_log.id"),
-        "task_id": text("task.id"),
-        "job_id": text("task_log.job_id"),
-        "status": text("task_status.name"),
-        "status_id": text("task_log.status_id"),
-        "date": text("task_log.status_date"),
-        "message": text("task_log.message"),
-        "error": text("task_log.error"),
-    }
-
     logs = (
-        db.session.query()
-        .select_from(TaskLog)
-        .join(Task, Task.id == TaskLog.task_id)
+        db.select(
+            TaskLog.id.label("log_id"),
+            TaskLog.job_id,
+            TaskStatus.name.label("status"),
+            TaskLog.status_id,
+            TaskLog.status_date.label("date"),
+            TaskLog.message,
+            TaskLog.error,
+        )
         .outerjoin(TaskStatus, TaskStatus.id == TaskLog.status_id)
-        .filter(Task.id == task_id)
-        .add_columns(*cols.values())
-        .order_by(text(str("task_log.id desc")))
+        .where(TaskLog.task_id == task_id)
+        .order_by(TaskLog.id.desc())
     )
 
+    # count the task's log rows from the task_id index alone, without
+    # wrapping the joined page query.
+    total = db.session.query(func.count(TaskLog.id)).filter(TaskLog.task_id == task_id).scalar()
+
     me = []
 
-    me.append({"total": str(logs.count() or 0)})  # runs.total
+    me.append({"total": str(total or 0)})  # runs.total
     me.append({"empty_msg": "No log messages."})
 
     if request.args.get("gte"):
-        logs = logs.filter(TaskLog.id >= request.args["gte"])
+        logs = logs.where(TaskLog.id >= request.args["gte"])
 
     elif request.args.get("lt"):
-        logs = logs.filter(TaskLog.id < request.args["lt"]).limit(40)
+        logs = logs.where(TaskLog.id < request.args["lt"]).limit(40)
 
     else:
-        logs = logs.limit(40).offset(0)
-
-    for log in logs.all():
-        log = dict(zip(cols.keys(), log))
+        logs = logs.limit(40)
 
+    for log in db.session.execute(logs).mappings():
         me.append(
             {
                 "log_id": log["log_id"],
                 "job_id": ("(" + str(log["job_id"]) + ")" if log["job_id"] else ""),
-                "date": (
-                    datetime.datetime.strftime(
-                        log["date"],
-                        "%m/%-d/%y %H:%M:%S",
-                    )
-                    if log["date"] and isinstance(log["date"], datetime.datetime)
-                    else (log["date"] if log["date"] else "None")
-                ),
+                "date": _format_date(log["date"], "%m/%-d/%y %H:%M:%S", "None"),
                 "status": log["status"] if log["status"] else "None",
                 "message": html.escape(log["message"]),
                 "class": "error" if log["status_id"] == 2 or log["error"] == 1 else "",
@@ -930,7 +900,7 @@ def dash_log() -> Response:
         .outerjoin(User, User.id == Project.owner_id)
         .outerjoin(TaskStatus, TaskStatus.id == TaskLog.status_id)
         .add_columns(*cols.values())
-        .order_by(text(str(cols[split_sort[0]]) + " " + split_sort[1]))
+        .order_by(_sort_order(cols, split_sort))
     )
 
     me = [{"head": '["Task Name", "Project Name", "Owner", "Status", "Status Date", "Message"]'}]
@@ -966,13 +936,8 @@ def dash_log() -> Response:
                     if log["Owner"]
                     else "N/A"
                 ),
-                "Status Date": (
-                    datetime.datetime.strftime(
-                        log["Status Date"],
-                        "%a, %b %-d, %Y %H:%M:%S.%f",
-                    )
-                    if log["Status Date"] and isinstance(log["Status Date"], datetime.datetime)
-                    else (log["Status Date"] if log["Status Date"] else "None")
+                "Status Date": _format_date(
+                    log["Status Date"], "%a, %b %-d, %Y %H:%M:%S.%f", "None"
                 ),
                 "my_date_sort": log["Status Date"],
                 "Status": log["Status"] if log["Status"] else "None",
@@ -1030,7 +995,7 @@ def dash_error_log() -> Response:
         .join(TaskStatus, TaskStatus.id == TaskLog.status_id)
         .filter(TaskLog.error == 1)
         .add_columns(*cols.values())
-        .order_by(text(str(cols[split_sort[0]]) + " " + split_sort[1]))
+        .order_by(_sort_order(cols, split_sort))
     )
 
     me = [{"head": '["Task Name", "Project Name", "Owner", "Status", "Status Date", "Message"]'}]
@@ -1066,13 +1031,8 @@ def dash_error_log() -> Response:
                     if log["Owner"]
                     else "N/A"
                 ),
-                "Status Date": (
-                    datetime.datetime.strftime(
-                        log["Status Date"],
-                        "%a, %b %-d, %Y %H:%M:%S.%f",
-                    )
-                    if log["Status Date"] and isinstance(log["Status Date"], datetime.datetime)
-                    else (log["Status Date"] if log["Status Date"] else "None")
+                "Status Date": _format_date(
+                    log["Status Date"], "%a, %b %-d, %Y %H:%M:%S.%f", "None"
                 ),
                 "my_date_sort": log["Status Date"],
                 "Status": log["Status"] if log["Status"] else "None",
@@ -1119,7 +1079,7 @@ def one_task_files(task_id: int) -> Response:
         .select_from(TaskFile)
         .filter(TaskFile.task_id == task_id)
         .add_columns(*cols.values())
-        .order_by(text(str(cols[split_sort[0]]) + " " + split_sort[1]))
+        .order_by(_sort_order(cols, split_sort))
     )
 
     me = [{"head": '["File Name", "Run Id", "Created", "md5 Hash", "File Size", "Action"]'}]
@@ -1129,9 +1089,8 @@ def one_task_files(task_id: int) -> Response:
     me.append({"sort": sort})  # page
     me.append({"empty_msg": "No files available."})
 
-    task = Task.query.filter_by(id=task_id)
-    if task.count() > 0:
-        task = task.first()
+    task = db.session.get(Task, task_id)
+    if task:
         for my_file in my_files.limit(10).offset(page * 10).all():
             my_file = dict(zip(cols.keys(), my_file))
 
@@ -1145,13 +1104,8 @@ def one_task_files(task_id: int) -> Response:
                     + "'>"
                     + str(my_file["Run Id"])
                     + "</a>",
-                    "Created": (
-                        datetime.datetime.strftime(
-                            my_file["Created"],
-                            "%a, %b %-d, %Y %H:%M:%S.%f",
-                        )
-                        if my_file["Created"] and isinstance(my_file["Created"], datetime.datetime)
-                        else (my_file["Created"] if my_file["Created"] else "N/A")
+                    "Created": _format_date(
+                        my_file["Created"], "%a, %b %-d, %Y %H:%M:%S.%f", "N/A"
                     ),
                     "File Size": my_file["File Size"],
                     "md5 Hash": my_file["md5 Hash"],
@@ -1,19 +1,23 @@
 """Task web views."""
 
+import hashlib
 import json
-from typing import Union
+from collections import defaultdict
+from typing import Dict, Optional, Tuple, Type, Union
 
 import requests
 from flask import Blueprint
 from flask import current_app as app
-from flask import flash, redirect, render_template, request, url_for
+from flask import flash, make_response, redirect, render_template, request, session, url_for
 from flask_login import current_user, login_required
 from RelativeToNow import relative_to_now
+from sqlalchemy.orm import Load
 from sqlalchemy.sql import functions as func
 from werkzeug.wrappers import Response
 
-from web import db
+from web import db, redis_client
 from web.model import (
+    TASK_DETAIL_OPTIONS,
     Connection,
     ConnectionDatabase,
     ConnectionFtp,
@@ -26,7 +30,10 @@ from web.model import (
     TaskLog,
     User,
 )
-from web.web import submit_executor
+from web.web import http_session, submit_executor
+
+from .task_controls import DATE_FORMAT
+from .task_edit import CONNECTION_PICKERS_KEY, CONNECTIONS_VERSION_KEY
 
 task_bp = Blueprint("task_bp", __name__)
 
@@ -35,27 +42,29 @@ task_bp = Blueprint("task_bp", __name__)
 @login_required
 def all_tasks() -> Union[str, Response]:
     """Page for all tasks."""
-    if Task.query.count() < 1:
-        return redirect(url_for("project_bp.all_projects"))
-
-    owners = (
-        db.session.query()
-        .select_from(User)
-        .join(Project, Project.owner_id == User.id)
-        .join(Task, Task.project_id == Project.id)
-        .add_columns(User.full_name, User.id, func.count(Task.id))
-        .group_by(User.full_name, User.id)
-        .all()
-    )
-
-    projects = (
+    # task counts per project along with the project owner. the owner
+    # totals are rolled up from the same rows.
+    rows = (
         db.session.query()
         .select_from(Project)
         .join(Task, Task.project_id == Project.id)
-        .add_columns(Project.name, Project.id, func.count(Task.id))
-        .group_by(Project.name, Project.id)
+        .outerjoin(User, User.id == Project.owner_id)
+        .add_columns(Project.name, Project.id, func.count(Task.id), User.full_name, User.id)
+        .group_by(Project.name, Project.id, User.full_name, User.id)
         .all()
     )
+
+    if not rows:
+        return redirect(url_for("project_bp.all_projects"))
+
+    projects = [(name, project_id, count) for name, project_id, count, _, _ in rows]
+
+    owner_counts: Dict[Tuple[Optional[str], int], int] = defaultdict(int)
+    for _, _, count, full_name, user_id in rows:
+        if user_id is not None:
+            owner_counts[(full_name, user_id)] += count
+    owners = [(full_name, user_id, count) for (full_name, user_id), count in owner_counts.items()]
+
     return render_template(
         "pages/task/all.html.j2", title="Tasks", owners=owners, projects=projects
     )
@@ -65,27 +74,20 @@ def all_tasks() -> Union[str, Response]:
 @login_required
 def my_tasks() -> Union[str, Response]:
     """Page for my tasks."""
-    me = (
-        Task.query.join(Project)
-        .join(User, User.id == Project.owner_id)
-        .filter(User.id == current_user.id)
-        .count()
-    )
-    if me < 1:
-        flash("You don't have any tasks.")
-        return redirect(url_for("project_bp.user_projects"))
-
     projects = (
         db.session.query()
         .select_from(Project)
-        .join(User, User.id == Project.owner_id)
         .join(Task, Task.project_id == Project.id)
-        .filter(User.id == current_user.id)
+        .filter(Project.owner_id == current_user.id)
         .add_columns(Project.name, Project.id, func.count(Task.id))
         .group_by(Project.name, Project.id)
         .all()
     )
 
+    if not projects:
+        flash("You don't have any tasks.")
+        return redirect(url_for("project_bp.user_projects"))
+
     return render_template(
         "pages/task/all.html.j2",
         title="My Tasks",
@@ -98,19 +100,15 @@ def my_tasks() -> Union[str, Response]:
 @login_required
 def user_tasks(user_id: int) -> Union[Response, str]:
     """Page for tasks for a specific user."""
-    me = (
-        Task.query.join(Project)
-        .join(User, User.id == Project.owner_id)
-        .filter(User.id == user_id)
-        .count()
-    )
-    my_user = User.query.filter_by(id=user_id).first()
+    my_user = db.session.get(User, user_id)
 
     # pylint: disable=R1705
     if not my_user:
         flash("That user does not exist.")
         return redirect(url_for("project_bp.all_projects"))
-    elif me < 1:
+    elif not db.session.query(
+        Task.query.join(Project).filter(Project.owner_id == user_id).exists()
+    ).scalar():
         flash(f"{my_user} has no projects.")
         return redirect(url_for("project_bp.all_projects"))
 
@@ -125,67 +123,99 @@ def user_tasks(user_id: int) -> Union[Response, str]:
 @login_required
 def one_task(task_id: int) -> Union[str, Response]:
     """Get task details page."""
-    task = Task.query.filter_by(id=task_id).first()
-
-    if task:
-        return render_template(
-            "pages/task/one.html.j2",
-            t=task,
-            r=(
-                " (%s)" % task.next_run.strftime("%a, %b %-d, %Y %H:%M:%S")
-                if task.next_run  # and task.next_run > datetime.datetime.now()
-                else ""
-            ),
-            r_relative=(
-                relative_to_now(task.next_run)
-                if task.next_run  # and task.next_run > datetime.datetime.now()
-                else "N/A"
-            ),
-            l=(
-                " (%s)" % task.last_run.strftime("%a, %b %-d, %Y %H:%M:%S")
-                if task.last_run
-                else "Never"
-            ),
-            l_relative=(relative_to_now(task.last_run) if task.last_run else "Never"),
-            title=task.name,
-            language=("bash" if task.source_type_id == 6 else "sql"),
-            has_secrets=any(p.sensitive == 1 for p in task.params),
+    # the etag covers everything on the page that can change without a task
+    # edit: the runner updates status and run times, the project can be
+    # renamed or handed to a new owner, the owner's name can change, and the
+    # linked connections can be edited. live status comes from /hello.
+    stamp = (
+        db.session.query(
+            Task.updated,
+            Task.status_id,
+            Task.enabled,
+            Task.last_run,
+            Task.next_run,
+            Project.updated,
+            Project.owner_id,
+            User.full_name,
+        )
+        .outerjoin(Project, Project.id == Task.project_id)
+        .outerjoin(User, User.id == Project.owner_id)
+        .filter(Task.id == task_id)
+        .first()
+    )
+
+    if stamp:
+        connections_version = redis_client.get(CONNECTIONS_VERSION_KEY)
+        etag = hashlib.md5(
+            repr((task_id, current_user.id, connections_version, *stamp)).encode("utf8"),
+            usedforsecurity=False,
+        ).hexdigest()
+
+        # pending flash messages are shown on the next render, so don't let
+        # the browser keep its copy.
+        if "_flashes" not in session and request.if_none_match.contains_weak(etag):
+            return Response(status=304)
+
+        task = db.session.get(Task, task_id, options=TASK_DETAIL_OPTIONS)
+        response = make_response(
+            render_template(
+                "pages/task/one.html.j2",
+                t=task,
+                r=(
+                    " (%s)" % task.next_run.strftime(DATE_FORMAT)
+                    if task.next_run  # and task.next_run > datetime.datetime.now()
+                    else ""
+                ),
+                r_relative=(
+                    relative_to_now(task.next_run)
+                    if task.next_run  # and task.next_run > datetime.datetime.now()
+                    else "N/A"
+                ),
+                l=(" (%s)" % task.last_run.strftime(DATE_FORMAT) if task.last_run else "Never"),
+                l_relative=(relative_to_now(task.last_run) if task.last_run else "Never"),
+                title=task.name,
+                language=("bash" if task.source_type_id == 6 else "sql"),
+                has_secrets=any(p.sensitive == 1 for p in task.params),
+            )
         )
+        response.set_etag(etag, weak=True)
+        response.cache_control.no_cache = True
+        return response
 
     flash("Task does not exist.")
     return redirect(url_for("task_bp.all_tasks"))
 
 
-@task_bp.route("/task/<task_id>/source_code")
-@login_required
-def task_get_source_code(task_id: int) -> str:
-    """Get source code for a task."""
+def _runner_code(task_id: int, segment: str, label: str) -> str:
+    """Get a block of task code from the runner, logging failures on the task."""
     try:
-        code = json.loads(
-            requests.get(
-                app.config["RUNNER_HOST"] + "/" + task_id + "/source_code", timeout=60
-            ).text
+        return json.loads(
+            http_session.get(
+                app.config["RUNNER_HOST"] + "/" + str(task_id) + "/" + segment, timeout=60
+            ).content
         )["code"]
-    # pylint: disable=broad-except
-    except BaseException as e:
-        if Task.query.filter_by(id=task_id).first():
+    except (requests.RequestException, ValueError, KeyError) as e:
+        if db.session.get(Task, task_id):
             log = TaskLog(
                 status_id=7,
                 error=1,
                 task_id=task_id,
                 message=(
-                    (current_user.full_name or "none")
-                    + ": Failed to get source code. ("
-                    + str(task_id)
-                    + ")\n"
-                    + str(e)
+                    f"{current_user.full_name or 'none'}: Failed to get {label}. ({task_id})\n{e}"
                 ),
             )
             db.session.add(log)
             db.session.commit()
-        code = "error."
+        return "error."
+
+
+@task_bp.route("/task/<task_id>/source_code")
+@login_required
+def task_get_source_code(task_id: int) -> str:
+    """Get source code for a task."""
+    code = _runner_code(task_id, "source_code", "source code")
 
-    task = Task.query.filter_by(id=task_id).first()
+    task = db.session.get(Task, task_id)
     return render_template(
         "pages/task/code.html.j2",
         code=code,
@@ -206,276 +236,91 @@ def refresh_cache(task_id: int) -> Response:
 @login_required
 def task_get_processing_code(task_id: int) -> str:
     """Get processing code for a task."""
-    try:
-        code = json.loads(
-            requests.get(
-                app.config["RUNNER_HOST"] + "/" + task_id + "/processing_code",
-                timeout=60,
-            ).text
-        )["code"]
-    # pylint: disable=broad-except
-    except BaseException as e:
-        if Task.query.filter_by(id=task_id).first():
-            log = TaskLog(
-                status_id=7,
-                error=1,
-                task_id=task_id,
-                message=(
-                    (current_user.full_name or "none")
-                    + ": Failed to get processing code. ("
-                    + str(task_id)
-                    + ")\n"
-                    + str(e)
-                ),
-            )
-            db.session.add(log)
-            db.session.commit()
-        code = "error."
-
     return render_template(
         "pages/task/code.html.j2",
-        code=code,
-    )
-
-
-@task_bp.route("/task/sftp-dest")
-@login_required
-def task_sftp_dest() -> str:
-    """Template to add sftp destination to a task."""
-    org = request.args.get("org", default=1, type=int)
-    dest = ConnectionSftp.query.filter_by(connection_id=org).order_by(ConnectionSftp.name).all()
-    org = Connection.query.filter_by(id=org).first()
-
-    return render_template(
-        "pages/task/dest/sftp_dest.html.j2",
-        org=org,
-        sftp_dest=dest,
-        title="Connections",
+        code=_runner_code(task_id, "processing_code", "processing code"),
     )
 
 
-@task_bp.route("/task/gpg-file")
-@login_required
-def task_gpg_file() -> str:
-    """Template to add gpg encryption to a task."""
-    org = request.args.get("org", default=1, type=int)
-    dest = ConnectionGpg.query.filter_by(connection_id=org).order_by(ConnectionGpg.name).all()
-    org = Connection.query.filter_by(id=org).first()
-
-    return render_template(
-        "pages/task/dest/gpg_file.html.j2",
-        org=org,
-        gpg_file=dest,
-        title="Connections",
-    )
-
-
-@task_bp.route("/task/sftp-source")
-@login_required
-def task_sftp_source() -> str:
-    """Template to add sftp source to a task."""
-    org = request.args.get("org", default=1, type=int)
-    dest = ConnectionSftp.query.filter_by(connection_id=org).order_by(ConnectionSftp.name).all()
-    org = Connection.query.filter_by(id=org).first()
-
-    return render_template(
-        "pages/task/source/sftp_source.html.j2",
-        org=org,
-        sftp_source=dest,
-        title="Connections",
-    )
-
-
-@task_bp.route("/task/ssh-source")
-@login_required
-def task_ssh_source() -> str:
-    """Template to add ssh source to a task."""
-    org = request.args.get("org", default=1, type=int)
-    dest = ConnectionSsh.query.filter_by(connection_id=org).order_by(ConnectionSsh.name).all()
-    org = Connection.query.filter_by(id=org).first()
-
-    return render_template(
-        "pages/task/source/ssh_source.html.j2",
-        org=org,
-        ssh_source=dest,
-        title="Connections",
-    )
-
-
-@task_bp.route("/task/sftp-query")
-@login_required
-def task_sftp_query() -> str:
-    """Template to add sftp query source to a task."""
-    org = request.args.get("org", default=1, type=int)
-    dest = ConnectionSftp.query.filter_by(connection_id=org).order_by(ConnectionSftp.name).all()
-    org = Connection.query.filter_by(id=org).first()
-
-    return render_template(
-        "pages/task/query/sftp_query.html.j2",
-        org=org,
-        sftp_query=dest,
-        title="Connections",
-    )
-
-
-@task_bp.route("/task/sftp-processing")
-@login_required
-def task_sftp_processing() -> str:
-    """Template to add sftp processing source to a task."""
-    org = request.args.get("org", default=1, type=int)
-    dest = ConnectionSftp.query.filter_by(connection_id=org).order_by(ConnectionSftp.name).all()
-
-    org = Connection.query.filter_by(id=org).first()
-
-    return render_template(
-        "pages/task/processing/sftp_processing.html.j2",
-        org=org,
-        sftp_processing=dest,
-        title="Connections",
-    )
-
-
-@task_bp.route("/task/ftp-dest")
-@login_required
-def task_ftp_dest() -> str:
-    """Template to add ftp destination to a task."""
-    org = request.args.get("org", default=1, type=int)
-    dest = ConnectionFtp.query.filter_by(connection_id=org).order_by(ConnectionFtp.name).all()
-    org = Connection.query.filter_by(id=org).first()
-
-    return render_template(
-        "pages/task/dest/ftp_dest.html.j2", org=org, ftp_dest=dest, title="Connections"
-    )
-
-
-@task_bp.route("/task/ftp-source")
-@login_required
-def task_ftp_source() -> str:
-    """Template to add ftp source to a task."""
-    org = request.args.get("org", default=1, type=int)
-    dest = ConnectionFtp.query.filter_by(connection_id=org).order_by(ConnectionFtp.name).all()
-    org = Connection.query.filter_by(id=org).first()
-
-    return render_template(
-        "pages/task/source/ftp_source.html.j2",
-        org=org,
-        ftp_source=dest,
-        title="Connections",
-    )
-
-
-@task_bp.route("/task/ftp-processing")
-@login_required
-def task_ftp_processing() -> str:
-    """Template to add ftp processing source to a task."""
-    org = request.args.get("org", default=1, type=int)
-    dest = ConnectionFtp.query.filter_by(connection_id=org).order_by(ConnectionFtp.name).all()
-    org = Connection.query.filter_by(id=org).first()
-    return render_template(
-        "pages/task/processing/ftp_processing.html.j2",
-        org=org,
-        ftp_processing=dest,
-        title="Connections",
-    )
-
-
-@task_bp.route("/task/ftp-query")
-@login_required
-def task_ftp_query() -> str:
-    """Template to add ftp query source to a task."""
-    org = request.args.get("org", default=1, type=int)
-    dest = ConnectionFtp.query.filter_by(connection_id=org).order_by(ConnectionFtp.name).all()
-    org = Connection.query.filter_by(id=org).first()
-
-    return render_template(
-        "pages/task/query/ftp_query.html.j2",
-        org=org,
-        ftp_query=dest,
-        title="Connections",
-    )
-
-
-@task_bp.route("/task/smb-source")
-@login_required
-def task_smb_source() -> str:
-    """Template to add smb source to a task."""
-    org = request.args.get("org", default=1, type=int)
-    dest = ConnectionSmb.query.filter_by(connection_id=org).order_by(ConnectionSmb.name).all()
-    org = Connection.query.filter_by(id=org).first()
+# connection pickers loaded into the task form, by url: the connection table
+# listed and the template that renders it. the list is passed to the template
+# under the url name, e.g. sftp_dest.
+CONNECTION_PICKERS: Dict[str, Tuple[Type[db.Model], str]] = {
+    "sftp-dest": (ConnectionSftp, "pages/task/dest/sftp_dest.html.j2"),
+    "gpg-file": (ConnectionGpg, "pages/task/dest/gpg_file.html.j2"),
+    "sftp-source": (ConnectionSftp, "pages/task/source/sftp_source.html.j2"),
+    "ssh-source": (ConnectionSsh, "pages/task/source/ssh_source.html.j2"),
+    "sftp-query": (ConnectionSftp, "pages/task/query/sftp_query.html.j2"),
+    "sftp-processing": (ConnectionSftp, "pages/task/processing/sftp_processing.html.j2"),
+    "ftp-dest": (ConnectionFtp, "pages/task/dest/ftp_dest.html.j2"),
+    "ftp-source": (ConnectionFtp, "pages/task/source/ftp_source.html.j2"),
+    "ftp-processing": (ConnectionFtp, "pages/task/processing/ftp_processing.html.j2"),
+    "ftp-query": (ConnectionFtp, "pages/task/query/ftp_query.html.j2"),
+    "smb-source": (ConnectionSmb, "pages/task/source/smb_source.html.j2"),
+    "smb-dest": (ConnectionSmb, "pages/task/dest/smb_dest.html.j2"),
+    "smb-query": (ConnectionSmb, "pages/task/query/smb_query.html.j2"),
+    "smb-processing": (ConnectionSmb, "pages/task/processing/smb_processing.html.j2"),
+    "database-source": (ConnectionDatabase, "pages/task/source/database_source.html.j2"),
+}
+
+
+def _connection_picker_html(picker: str, org: int) -> str:
+    """Render a connection picker, or get it from the cache."""
+    model, template = CONNECTION_PICKERS[picker]
+
+    # the html only changes when a connection is edited, which bumps the version in the key.
+    # each picker gets its own key so the 300 second expiry holds for every entry.
+    version = (redis_client.get(CONNECTIONS_VERSION_KEY) or b"0").decode("utf8")
+    key = f"{CONNECTION_PICKERS_KEY}:{version}:{picker}-{org}"
+    cached = redis_client.get(key)
+    if cached is not None:
+        return cached.decode("utf8")
+
+    # the connection and its rows of this type in one query. the templates only read
+    # the connection's contact email and the id and name of each row, so skip the
+    # selectin collections and leave credentials out of the select.
+    rows = db.session.execute(
+        db.select(Connection, model)
+        .outerjoin(model, model.connection_id == Connection.id)
+        .filter(Connection.id == org)
+        .order_by(model.name)
+        .options(
+            Load(Connection).load_only(Connection.primary_contact_email).lazyload("*"),
+            Load(model).load_only(model.id, model.name).lazyload("*"),
+        )
+    ).all()
 
-    return render_template(
-        "pages/task/source/smb_source.html.j2",
-        org=org,
-        smb_source=dest,
+    html = render_template(
+        template,
+        org=rows[0][0] if rows else None,
         title="Connections",
+        **{picker.replace("-", "_"): [row[1] for row in rows if row[1] is not None]},
     )
 
+    redis_client.setex(key, 300, html)
 
-@task_bp.route("/task/smb-dest")
-@login_required
-def task_smb_dest() -> str:
-    """Template to add smb destination to a task."""
-    org = request.args.get("org", default=1, type=int)
-    dest = ConnectionSmb.query.filter_by(connection_id=org).order_by(ConnectionSmb.name).all()
-    org = Connection.query.filter_by(id=org).first()
-
-    return render_template(
-        "pages/task/dest/smb_dest.html.j2", org=org, smb_dest=dest, title="Connections"
-    )
-
-
-@task_bp.route("/task/smb-query")
-@login_required
-def task_smb_query() -> str:
-    """Template to add smb query source to a task."""
-    org = request.args.get("org", default=1, type=int)
-    query = ConnectionSmb.query.filter_by(connection_id=org).order_by(ConnectionSmb.name).all()
-    org = Connection.query.filter_by(id=org).first()
-
-    return render_template(
-        "pages/task/query/smb_query.html.j2",
-        org=org,
-        smb_query=query,
-        title="Connections",
-    )
+    return html
 
 
-@task_bp.route("/task/smb-processing")
 @login_required
-def task_smb_processing() -> str:
-    """Template to add smb processing source to a task."""
+def task_connection_picker(picker: str) -> Response:
+    """Template to add a connection to a task."""
     org = request.args.get("org", default=1, type=int)
-    processing = (
-        ConnectionSmb.query.filter_by(connection_id=org).order_by(ConnectionSmb.name).all()
-    )
-    org = Connection.query.filter_by(id=org).first()
-
-    return render_template(
-        "pages/task/processing/smb_processing.html.j2",
-        org=org,
-        smb_processing=processing,
-        title="Connections",
-    )
 
+    # the task editor reloads the same pickers as the user switches options. tag
+    # the html so the browser can revalidate its copy instead of downloading it.
+    response = make_response(_connection_picker_html(picker, org))
+    response.add_etag(weak=True)
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
 
-@task_bp.route("/task/database-source")
-@login_required
-def task_database_source() -> str:
-    """Template to add database source to a task."""
-    org = request.args.get("org", default=1, type=int)
-
-    dest = (
-        ConnectionDatabase.query.filter_by(connection_id=org)
-        .order_by(ConnectionDatabase.name)
-        .all()
-    )
-    org = Connection.query.filter_by(id=org).first()
 
-    return render_template(
-        "pages/task/source/database_source.html.j2",
-        org=org,
-        database_source=dest,
-        title="Connections",
+for _picker in CONNECTION_PICKERS:
+    task_bp.add_url_rule(
+        f"/task/{_picker}",
+        endpoint="task_" + _picker.replace("-", "_"),
+        view_func=task_connection_picker,
+        defaults={"picker": _picker},
     )
 
 
@@ -484,11 +329,11 @@ def task_database_source() -> str:
 def email_success_subject_preview(task_id: int) -> str:
     """Generate a task filename preview."""
     try:
-        return requests.get(
+        return http_session.get(
             f"{app.config['RUNNER_HOST']}/task/{task_id}/email_success_subject_preview",
             timeout=60,
         ).text
-    except BaseException as e:
+    except requests.RequestException as e:
         return f'<span class="has-tooltip-arrow has-tooltip-right has-tooltip-multiline tag is-danger is-light" data-tooltip="{e}">Offline</span>'
 
 
@@ -497,9 +342,9 @@ def email_success_subject_preview(task_id: int) -> str:
 def email_error_subject_preview(task_id: int) -> str:
     """Generate a task filename preview."""
     try:
-        return requests.get(
+        return http_session.get(
             f"{app.config['RUNNER_HOST']}/task/{task_id}/email_error_subject_preview",
             timeout=60,
         ).text
-    except BaseException as e:
+    except requests.RequestException as e:
         return f'<span class="has-tooltip-arrow has-tooltip-right has-tooltip-multiline tag is-danger is-light" data-tooltip="{e}">Offline</span>'
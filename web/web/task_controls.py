@@ -1,64 +1,71 @@
 """Task web views."""
 
+import json
+
 import requests
 from flask import Blueprint
 from flask import current_app as app
 from flask import flash, jsonify, redirect, url_for
 from flask_login import current_user, login_required
 from RelativeToNow import relative_to_now
+from sqlalchemy.orm import load_only, raiseload
 from werkzeug.wrappers import Response
 
 from web import db, redis_client
-from web.model import Task, TaskFile, TaskLog, TaskParam
-from web.web import submit_executor
+from web.model import TASK_LIST_OPTIONS, Task, TaskLog, TaskParam
+from web.web import http_session, submit_executor
 
 task_controls_bp = Blueprint("task_controls_bp", __name__)
 
+DATE_FORMAT = "%a, %b %-d, %Y %H:%M:%S"
+
 
 @task_controls_bp.route("/task/<task_id>/run")
 @login_required
 def run_task(task_id: int) -> Response:
     """Run a task."""
-    task = Task.query.filter_by(id=task_id).first()
-    redis_client.delete("runner_" + str(task_id) + "_attempt")
+    task = db.session.get(Task, task_id, options=TASK_LIST_OPTIONS)
+    # clear the retry counter and the cached status (which shows that counter)
+    # in one round trip.
+    redis_client.delete(f"runner_{task_id}_attempt", f"atlas_hub_task_hello-{task_id}")
     if task:
         # if the task is a sequence and enabled
         # then kick off all other tasks with same rank.
         if task.project.sequence_tasks == 1 and task.enabled == 1:
-            tasks = db.session.execute(
-                db.select(Task).filter_by(project_id=task.project_id, enabled=1, order=task.order)
+            tsk_ids = db.session.execute(
+                db.select(Task.id).filter_by(
+                    project_id=task.project_id, enabled=True, order=task.order
+                )
             ).scalars()
-            for tsk in tasks:
+            # one commit for the run logs of the whole sequence rank.
+            for tsk_id in tsk_ids:
                 try:
-                    requests.get(app.config["SCHEDULER_HOST"] + "/run/" + str(tsk.id), timeout=60)
+                    http_session.get(
+                        app.config["SCHEDULER_HOST"] + "/run/" + str(tsk_id), timeout=60
+                    )
                     log = TaskLog(  # type: ignore[call-arg]
-                        task_id=tsk.id,
+                        task_id=tsk_id,
                         status_id=7,
                         message=(current_user.full_name or "none") + ": Task manually run.",
                     )
                     db.session.add(log)
-                    db.session.commit()
                     flash("Task run started.")
-                # pylint: disable=broad-except
-                except BaseException as e:
+                except requests.RequestException as e:
                     log = TaskLog(  # type: ignore[call-arg]
                         status_id=7,
                         error=1,
-                        task_id=tsk.id,
+                        task_id=tsk_id,
                         message=(
-                            (current_user.full_name or "none")
-                            + ": Failed to manually run task. ("
-                            + str(tsk.id)
-                            + ")\n"
-                            + str(e)
+                            f"{current_user.full_name or 'none'}: "
+                            f"Failed to manually run task. ({tsk_id})\n{e}"
                         ),
                     )
                     db.session.add(log)
-                    db.session.commit()
                     flash("Failed to run task.")
+            db.session.commit()
         else:
             try:
-                requests.get(app.config["SCHEDULER_HOST"] + "/run/" + str(task_id), timeout=60)
+                http_session.get(app.config["SCHEDULER_HOST"] + "/run/" + str(task_id), timeout=60)
                 log = TaskLog(  # type: ignore[call-arg]
                     task_id=task.id,
                     status_id=7,
@@ -67,18 +74,14 @@ def run_task(task_id: int) -> Response:
                 db.session.add(log)
                 db.session.commit()
                 flash("Task run started.")
-            # pylint: disable=broad-except
-            except BaseException as e:
+            except requests.RequestException as e:
                 log = TaskLog(  # type: ignore[call-arg]
                     status_id=7,
                     error=1,
                     task_id=task_id,
                     message=(
-                        (current_user.full_name or "none")
-                        + ": Failed to manually run task. ("
-                        + str(task_id)
-                        + ")\n"
-                        + str(e)
+                        f"{current_user.full_name or 'none'}: "
+                        f"Failed to manually run task. ({task_id})\n{e}"
                     ),
                 )
                 db.session.add(log)
@@ -124,37 +127,58 @@ def disable_task(task_id: int) -> str:
 @login_required
 def duplicate_task(task_id: int) -> Response:
     """Duplicate a task."""
-    my_task = Task.query.filter_by(id=task_id).first()
-    if my_task:
-        new_task = Task()
-
-        # pylint: disable=protected-access
-        for key in my_task.__table__.columns.keys():
-            if key not in ["id", "last_run", "last_run_job_id", "status_id"]:
-                setattr(new_task, key, getattr(my_task, key))
-
-        new_task.enabled = 0
-        new_task.creator_id = current_user.id
-        new_task.updater_id = current_user.id
-        new_task.status_id = None
-        new_task.name = str(my_task.name or "") + " - Duplicated"
-
-        db.session.add(new_task)
+    # copy the task and its params in the database instead of loading every
+    # column (including the deferred code blocks) into python.
+    task_columns = [
+        column
+        for column in Task.__table__.columns
+        if column.name
+        not in [
+            "id",
+            "name",
+            "enabled",
+            "status_id",
+            "last_run",
+            "last_run_job_id",
+            "created",
+            "creator_id",
+            "updated",
+            "updater_id",
+        ]
+    ]
+    new_task_id = db.session.execute(
+        db.insert(Task)
+        .from_select(
+            [column.name for column in task_columns]
+            + ["name", "enabled", "creator_id", "updater_id"],
+            db.select(
+                *task_columns,
+                db.func.coalesce(Task.name, "") + " - Duplicated",
+                db.false(),
+                db.literal(current_user.id),
+                db.literal(current_user.id),
+            ).where(Task.id == task_id),
+        )
+        .returning(Task.id)
+    ).scalar()
+
+    if new_task_id:
+        param_columns = [
+            column
+            for column in TaskParam.__table__.columns
+            if column.name not in ["id", "task_id"]
+        ]
+        db.session.execute(
+            db.insert(TaskParam).from_select(
+                [column.name for column in param_columns] + ["task_id"],
+                db.select(*param_columns, db.literal(new_task_id)).where(
+                    TaskParam.task_id == task_id
+                ),
+            )
+        )
         db.session.commit()
 
-        # copy parameters
-        for my_param in TaskParam.query.filter_by(task_id=task_id).all():
-            if my_param:
-                new_param = TaskParam()
-                for key in my_param.__table__.columns.keys():
-                    if key not in ["id", "task_id"]:
-                        setattr(new_param, key, getattr(my_param, key))
-
-                new_param.task_id = new_task.id
-                db.session.add(new_param)
-                db.session.commit()
-
-        return redirect(url_for("task_edit_bp.task_edit_get", task_id=new_task.id))
+        return redirect(url_for("task_edit_bp.task_edit_get", task_id=new_task_id))
 
     flash("Task does not exist.")
     return redirect(url_for("task_bp.all_tasks"))
@@ -163,42 +187,45 @@ def duplicate_task(task_id: int) -> Response:
 @task_controls_bp.route("/task/<task_id>/hello")
 @login_required
 def task_status(task_id: int) -> Response:
-    """Get basic task info."""
-    task = Task.query.filter_by(id=task_id).first()
+    """Get basic task info.
+
+    The task page polls this, so the response is kept in redis for a second
+    and shared by every open page.
+    """
+    cached = redis_client.get(f"atlas_hub_task_hello-{task_id}")
+    if cached:
+        return Response(cached, mimetype="application/json")
+
+    # only the status columns, without the joined connection and project rows.
+    task = db.session.get(
+        Task,
+        task_id,
+        options=(
+            load_only(Task.status_id, Task.max_retries, Task.next_run, Task.last_run),
+            raiseload("*"),
+        ),
+    )
 
     if task:
-        attempt = redis_client.zincrby("runner_" + str(task_id) + "_attempt", 0, "inc") or 0
+        attempt = redis_client.zscore("runner_" + str(task_id) + "_attempt", "inc") or 0
+        status = task.status_name or ""
+        if attempt > 0 and status == "Running":
+            status += " (attempt %d of %d)" % (attempt, task.max_retries)
+
+        next_run = task.next_run.astimezone() if task.next_run else None
+        last_run = task.last_run.astimezone() if task.last_run else None
 
-        return jsonify(
+        body = json.dumps(
             {
-                "status": (
-                    task.status.name
-                    + (
-                        " (attempt %d of %d)" % (attempt, task.max_retries)
-                        if attempt > 0 and task.status.name == "Running"
-                        else ""
-                    )
-                    if task.status
-                    else ""
-                ),
-                "next_run": (
-                    relative_to_now(task.next_run.astimezone())
-                    if task.next_run  # and task.next_run > datetime.datetime.now()
-                    else "N/A"
-                ),
-                "next_run_abs": (
-                    " (%s)" % task.next_run.astimezone().strftime("%a, %b %-d, %Y %H:%M:%S")
-                    if task.next_run  # and task.next_run > datetime.datetime.now()
-                    else ""
-                ),
-                "last_run": (relative_to_now(task.last_run.astimezone()) if task.last_run else ""),
-                "last_run_abs": (
-                    " (%s)" % task.last_run.astimezone().strftime("%a, %b %-d, %Y %H:%M:%S")
-                    if task.last_run
-                    else ""
-                ),
+                "status": status,
+                "next_run": relative_to_now(next_run) if next_run else "N/A",
+                "next_run_abs": " (%s)" % next_run.strftime(DATE_FORMAT) if next_run else "",
+                "last_run": relative_to_now(last_run) if last_run else "",
+                "last_run_abs": " (%s)" % last_run.strftime(DATE_FORMAT) if last_run else "",
             }
         )
+        redis_client.setex(f"atlas_hub_task_hello-{task_id}", 1, body)
+        return Response(body, mimetype="application/json")
 
     return jsonify({})
 
@@ -207,25 +234,19 @@ def task_status(task_id: int) -> Response:
 @login_required
 def delete_task(task_id: int) -> Response:
     """Delete a task."""
-    task = Task.query.filter_by(id=task_id).first()
+    task = db.session.get(Task, task_id, options=(raiseload("*"),))
 
     if task:
         project_id = task.project_id
 
         submit_executor("disable_task", task_id)
 
-        TaskLog.query.filter_by(task_id=task_id).delete()
-        db.session.commit()
-        TaskFile.query.filter_by(task_id=task_id).delete()
-        db.session.commit()
-        TaskParam.query.filter_by(task_id=task_id).delete()
-        db.session.commit()
+        # logs, files and params go with the task through ON DELETE CASCADE.
         Task.query.filter_by(id=task_id).delete()
-        db.session.commit()
 
         log = TaskLog(  # type: ignore[call-arg]
             status_id=7,
-            message=(current_user.full_name or "none") + ": Task deleted. (" + str(task_id) + ")",
+            message=f"{current_user.full_name or 'none'}: Task deleted. ({task_id})",
         )
         db.session.add(log)
         db.session.commit()
@@ -248,7 +269,7 @@ def task_endretry(task_id: int) -> Response:
     clear any scheduled jobs that do not belong to
     the primary schedule.
     """
-    task = Task.query.filter_by(id=task_id).first()
+    task = db.session.get(Task, task_id, options=(raiseload("*"),))
     if task:
         if task.enabled == 1:
             submit_executor("enable_task", task_id)
@@ -273,18 +294,19 @@ def task_endretry(task_id: int) -> Response:
 @login_required
 def reset_task(task_id: int) -> Response:
     """Reset a task status to completed."""
-    task = Task.query.filter_by(id=task_id).first()
-    if task:
-        task.status_id = 4
-        db.session.commit()
+    name = current_user.full_name or "none"
 
+    # update in place, the task row is not needed for anything else.
+    if Task.query.filter_by(id=task_id).update({Task.status_id: 4}, synchronize_session=False):
         log = TaskLog(  # type: ignore[call-arg]
-            task_id=task.id,
+            task_id=task_id,
             status_id=7,
-            message=(current_user.full_name or "none") + ": Reset task status to completed.",
+            message=f"{name}: Reset task status to completed.",
         )
         db.session.add(log)
         db.session.commit()
+        redis_client.delete(f"atlas_hub_task_hello-{task_id}")
+
         flash("Task has been reset to completed.")
         return redirect(url_for("task_bp.one_task", task_id=task_id))
     flash("Task does not exist.")
@@ -1,16 +1,21 @@
 """Task web views."""
 
-from typing import Union
+import json
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, NamedTuple, Optional, Type, Union
 
 from crypto import em_encrypt
 from flask import Blueprint
 from flask import current_app as app
 from flask import flash, redirect, render_template, request, url_for
 from flask_login import current_user, login_required
+from werkzeug.datastructures import ImmutableMultiDict
 from werkzeug.wrappers import Response
 
-from web import cache, db
+from web import cache, db, redis_client
 from web.model import (
+    TASK_DETAIL_OPTIONS,
     Connection,
     ConnectionDatabase,
     ConnectionFtp,
@@ -34,51 +39,97 @@ from . import get_or_create
 
 task_edit_bp = Blueprint("task_edit_bp", __name__)
 
+TASK_FORM_OPTIONS_KEY = "atlas_hub_task_form_options"
+# prefix for the rendered connection pickers, one key per version, picker and connection.
+CONNECTION_PICKERS_KEY = "atlas_hub_connection_pickers"
+# changes whenever a connection is saved. task pages include it in their etag.
+CONNECTIONS_VERSION_KEY = "atlas_hub_connections_version"
+
+
+class _Option(NamedTuple):
+    """Dropdown option on the task form."""
+
+    id: int
+    name: Optional[str]
+
+
+def task_form_options() -> Dict[str, List[_Option]]:
+    """Get the task form dropdown lists, cached in redis for five minutes."""
+    cached = redis_client.get(TASK_FORM_OPTIONS_KEY)
+    if cached:
+        options = json.loads(cached)
+    else:
+        options = {
+            key: [
+                list(row)
+                for row in db.session.execute(db.select(model.id, model.name).order_by(order))
+            ]
+            for key, model, order in (
+                ("source_type", TaskSourceType, TaskSourceType.name),
+                ("source_query_type", TaskSourceQueryType, TaskSourceQueryType.name),
+                ("processing_type", TaskProcessingType, TaskProcessingType.name),
+                ("source", ConnectionDatabase, ConnectionDatabase.name),
+                ("conn", Connection, Connection.name),
+                ("file_type", TaskDestinationFileType, TaskDestinationFileType.id),
+                ("quote_level", QuoteLevel, QuoteLevel.id),
+            )
+        }
+        redis_client.setex(TASK_FORM_OPTIONS_KEY, 300, json.dumps(options))
+
+    return {key: [_Option(*row) for row in rows] for key, rows in options.items()}
+
+
+def clear_task_form_options() -> None:
+    """Drop the cached task form dropdowns and pickers after a connection changes."""
+    with redis_client.pipeline() as pipe:
+        pipe.delete(TASK_FORM_OPTIONS_KEY)
+        # a timestamp rather than a counter, so a flushed key can't repeat an old value.
+        # connection pickers are cached under this version, so this also drops them.
+        pipe.set(CONNECTIONS_VERSION_KEY, time.time_ns())
+        pipe.execute()
+
+
+def _by_connection(model: Type[db.Model], *conns: Optional[db.Model]) -> Dict[int, List]:
+    """Get all rows of a connection table for the connections of the given rows."""
+    connection_ids = {conn.connection_id for conn in conns if conn}
+    rows: Dict[int, List] = defaultdict(list)
+    if connection_ids:
+        for row in model.query.filter(model.connection_id.in_(connection_ids)).all():
+            rows[row.connection_id].append(row)
+    return rows
+
+
+def _siblings(rows: Dict[int, List], conn: Optional[db.Model]) -> Union[List, str]:
+    """Get the rows sharing a connection with conn, or "" when the task has none."""
+    return rows[conn.connection_id] if conn else ""
+
 
 @task_edit_bp.route("/project/<project_id>/task/new", methods=["GET"])
 @login_required
 def task_new_get(project_id: int) -> Union[str, Response]:
     """Create a new task."""
-    me = Project.query.filter_by(id=project_id).first()
+    me = db.session.get(Project, project_id)
     if me:
-        source_type = TaskSourceType.query.order_by(TaskSourceType.name).all()
-        source_query_type = TaskSourceQueryType.query.order_by(TaskSourceQueryType.name).all()
-        source = ConnectionDatabase.query.order_by(ConnectionDatabase.name).all()
-        conn = Connection.query.order_by(Connection.name).all()
-        file_type = TaskDestinationFileType.query.order_by(TaskDestinationFileType.id).all()
-        processing_type = TaskProcessingType.query.order_by(TaskProcessingType.name).all()
-        quote_level = QuoteLevel.query.order_by(QuoteLevel.id).all()
-
         return render_template(
             "pages/task/new.html.j2",
             p=me,
-            source_type=source_type,
-            source_query_type=source_query_type,
-            processing_type=processing_type,
-            quote_level=quote_level,
-            source=source,
-            conn=conn,
             title="New Task",
-            t=Task.query.filter_by(id=0).first(),
-            file_type=file_type,
+            t=None,
+            **task_form_options(),
         )
 
     flash("Project does not exist.")
     return redirect(url_for("project_bp.all_projects"))
 
 
-@task_edit_bp.route("/project/<project_id>/task/new", methods=["POST"])
-@login_required
-def task_new(project_id: int) -> Union[str, Response]:
-    """Create a new task."""
-    cache.clear()
-    # create tasks
-    form = request.form
+def _task_fields(form: ImmutableMultiDict) -> Dict[str, Any]:
+    """Read the task columns shared by the new and edit forms."""
+    # the name is also the default output and zip file name
+    name = form.get("name", "undefined", type=str)
 
-    me = Task(
-        name=form.get("name", "undefined").strip(),
-        project_id=project_id,
-        creator_id=current_user.id,
+    # pylint: disable=R1735
+    return dict(  # noqa: C408
+        name=name.strip(),
         updater_id=current_user.id,
         max_retries=form.get("task-retry", 0, type=int),
         order=form.get("task-rank", 0, type=int),
@@ -125,13 +176,9 @@ def task_new(project_id: int) -> Union[str, Response]:
         processing_command=form.get("processingCommand", None, type=str),
         destination_quote_level_id=form.get("quoteLevel", 3, type=int),
         destination_file_type_id=form.get("fileType", None, type=int),
-        destination_file_name=form.get(
-            "destinationFileName", form.get("name", "undefined", type=str), type=str
-        ),
+        destination_file_name=form.get("destinationFileName", name, type=str),
         destination_create_zip=form.get("task_create_zip", None, type=int),
-        destination_zip_name=form.get(
-            "destinationZipName", form.get("name", "undefined", type=str), type=str
-        ),
+        destination_zip_name=form.get("destinationZipName", name, type=str),
         destination_file_delimiter=form.get("fileDelimiter", None, type=str),
         destination_file_line_terminator=form.get("fileTerminator", None, type=str),
         destination_ignore_delimiter=form.get("task_ignore_file_delimiter", None, type=int),
@@ -164,8 +211,24 @@ def task_new(project_id: int) -> Union[str, Response]:
         enabled=form.get("task-ooff", 0, type=int),
     )
 
+
+@task_edit_bp.route("/project/<project_id>/task/new", methods=["POST"])
+@login_required
+def task_new(project_id: int) -> Union[str, Response]:
+    """Create a new task."""
+    cache.clear()
+    # create tasks
+    form = request.form
+
+    me = Task(
+        project_id=project_id,
+        creator_id=current_user.id,
+        **_task_fields(form),
+    )
+
     db.session.add(me)
-    db.session.commit()
+    # flush for the new id, everything below is committed together.
+    db.session.flush()
 
     # add params
     for param in list(
@@ -185,8 +248,6 @@ def task_new(project_id: int) -> Union[str, Response]:
                 )
             )
 
-    db.session.commit()
-
     log = TaskLog(
         task_id=me.id,
         status_id=7,
@@ -206,119 +267,59 @@ def task_new(project_id: int) -> Union[str, Response]:
 def task_edit_get(task_id: int) -> Union[Response, str]:
     """Task edit page."""
     # pylint: disable=too-many-locals
-    me = Task.query.filter_by(id=task_id).first()
+    me = db.session.get(Task, task_id, options=TASK_DETAIL_OPTIONS)
 
     if me:
-        source_type = TaskSourceType.query.order_by(TaskSourceType.name).all()
-        processing_type = TaskProcessingType.query.order_by(TaskProcessingType.name).all()
-        source_query_type = TaskSourceQueryType.query.order_by(TaskSourceQueryType.name).all()
-
-        source = ConnectionDatabase.query.order_by(ConnectionDatabase.name).all()
-
-        conn = Connection.query.order_by(Connection.name).all()
-
-        file_type = TaskDestinationFileType.query.order_by(TaskDestinationFileType.id).all()
-        sftp_dest = (
-            ConnectionSftp.query.filter_by(
-                connection_id=me.destination_sftp_conn.connection_id
-            ).all()
-            if me.destination_sftp_id
-            else ""
-        )
-        ftp_dest = (
-            ConnectionFtp.query.filter_by(
-                connection_id=me.destination_ftp_conn.connection_id
-            ).all()
-            if me.destination_ftp_id
-            else ""
-        )
-        smb_dest = (
-            ConnectionSmb.query.filter_by(
-                connection_id=me.destination_smb_conn.connection_id
-            ).all()
-            if me.destination_smb_id
-            else ""
-        )
-        gpg_file = (
-            (ConnectionGpg.query.filter_by(connection_id=me.file_gpg_conn.connection_id).all())
-            if me.file_gpg_conn
-            else ""
-        )
-        sftp_source = (
-            ConnectionSftp.query.filter_by(connection_id=me.source_sftp_conn.connection_id).all()
-            if me.source_sftp_id
-            else ""
-        )
-        sftp_query = (
-            ConnectionSftp.query.filter_by(connection_id=me.query_sftp_conn.connection_id).all()
-            if me.query_sftp_id
-            else ""
-        )
-        ssh_source = (
-            ConnectionSsh.query.filter_by(connection_id=me.source_ssh_conn.connection_id).all()
-            if me.source_ssh_id
-            else ""
+        # load the sibling rows of every connection the task uses with one
+        # query per connection type.
+        sftp = _by_connection(
+            ConnectionSftp,
+            me.destination_sftp_conn,
+            me.source_sftp_conn,
+            me.query_sftp_conn,
+            me.processing_sftp_conn,
         )
-        ftp_source = (
-            ConnectionFtp.query.filter_by(connection_id=me.source_ftp_conn.connection_id).all()
-            if me.source_ftp_id
-            else ""
+        ftp = _by_connection(
+            ConnectionFtp,
+            me.destination_ftp_conn,
+            me.source_ftp_conn,
+            me.query_ftp_conn,
+            me.processing_ftp_conn,
         )
-        ftp_query = (
-            ConnectionFtp.query.filter_by(connection_id=me.query_ftp_conn.connection_id).all()
-            if me.query_ftp_id
-            else ""
+        smb = _by_connection(
+            ConnectionSmb,
+            me.destination_smb_conn,
+            me.source_smb_conn,
+            me.query_smb_conn,
+            me.processing_smb_conn,
         )
-        smb_source = (
-            ConnectionSmb.query.filter_by(connection_id=me.source_smb_conn.connection_id).all()
-            if me.source_smb_id
-            else ""
-        )
-        smb_query = (
-            ConnectionSmb.query.filter_by(connection_id=me.query_smb_conn.connection_id).all()
-            if me.query_smb_id
-            else ""
-        )
-        database_source = (
-            ConnectionDatabase.query.filter_by(
-                connection_id=me.source_database_conn.connection_id
-            ).all()
-            if me.source_database_id
-            else ""
-        )
-
-        sftp_processing = (
-            ConnectionSftp.query.filter_by(
-                connection_id=me.processing_sftp_conn.connection_id
-            ).all()
-            if me.processing_sftp_id
-            else ""
-        )
-        ftp_processing = (
-            ConnectionFtp.query.filter_by(connection_id=me.processing_ftp_conn.connection_id).all()
-            if me.processing_ftp_id
-            else ""
-        )
-        smb_processing = (
-            ConnectionSmb.query.filter_by(connection_id=me.processing_smb_conn.connection_id).all()
-            if me.processing_smb_id
-            else ""
-        )
-
-        quote_level = QuoteLevel.query.order_by(QuoteLevel.id).all()
+        ssh = _by_connection(ConnectionSsh, me.source_ssh_conn)
+        gpg = _by_connection(ConnectionGpg, me.file_gpg_conn)
+        database = _by_connection(ConnectionDatabase, me.source_database_conn)
+
+        sftp_dest = _siblings(sftp, me.destination_sftp_conn)
+        ftp_dest = _siblings(ftp, me.destination_ftp_conn)
+        smb_dest = _siblings(smb, me.destination_smb_conn)
+        gpg_file = _siblings(gpg, me.file_gpg_conn)
+        sftp_source = _siblings(sftp, me.source_sftp_conn)
+        sftp_query = _siblings(sftp, me.query_sftp_conn)
+        ssh_source = _siblings(ssh, me.source_ssh_conn)
+        ftp_source = _siblings(ftp, me.source_ftp_conn)
+        ftp_query = _siblings(ftp, me.query_ftp_conn)
+        smb_source = _siblings(smb, me.source_smb_conn)
+        smb_query = _siblings(smb, me.query_smb_conn)
+        database_source = _siblings(database, me.source_database_conn)
+        sftp_processing = _siblings(sftp, me.processing_sftp_conn)
+        ftp_processing = _siblings(ftp, me.processing_ftp_conn)
+        smb_processing = _siblings(smb, me.processing_smb_conn)
 
         return render_template(
             "pages/task/new.html.j2",
             t=me,
             title="Editing " + me.name,
-            source_type=source_type,
-            processing_type=processing_type,
-            source_query_type=source_query_type,
-            source=source,
             sftp_dest=sftp_dest,
             ftp_dest=ftp_dest,
             smb_dest=smb_dest,
-            conn=conn,
             sftp_source=sftp_source,
             ftp_source=ftp_source,
             smb_source=smb_source,
@@ -331,9 +332,8 @@ def task_edit_get(task_id: int) -> Union[Response, str]:
             smb_processing=smb_processing,
             database_source=database_source,
             gpg_file=gpg_file,
-            file_type=file_type,
-            quote_level=quote_level,
             p=me.project,
+            **task_form_options(),
         )
 
     flash("Task does not exist.")
@@ -347,108 +347,14 @@ def task_edit_post(task_id: int) -> Response:
     # pylint: disable=too-many-branches
     # pylint: disable=too-many-statements
     form = request.form
+    fields = _task_fields(form)
 
     task = get_or_create(db.session, Task, id=task_id)
 
-    me = Task.query.filter_by(id=task.id)
-
-    # pylint: disable=R1735
-    me.update(
-        dict(  # noqa: C408
-            name=form.get("name", "undefined").strip(),
-            updater_id=current_user.id,
-            max_retries=form.get("task-retry", 0, type=int),
-            order=form.get("task-rank", 0, type=int),
-            source_type_id=form.get("sourceType", None, type=int),
-            source_database_id=form.get("task-source-database", None, type=int),
-            source_query_include_header=form.get("task_include_query_headers", None, type=int),
-            source_smb_id=form.get("task-source-smb", None, type=int),
-            source_smb_file=form.get("sourceSmbFile", None, type=str),
-            source_smb_ignore_delimiter=form.get("task_smb_ignore_delimiter", 0, type=int),
-            source_smb_delimiter=form.get("sourceSmbDelimiter", None, type=str),
-            source_sftp_id=form.get("task-source-sftp", None, type=int),
-            source_sftp_file=form.get("sourceSftpFile", None, type=str),
-            source_sftp_ignore_delimiter=form.get("task_sftp_ignore_delimiter", None, type=int),
-            source_sftp_delimiter=form.get("sourceSftpDelimiter", None, type=str),
-            source_ftp_id=form.get("task-source-ftp", None, type=int),
-            source_ftp_file=form.get("sourceFtpFile", None, type=str),
-            source_ftp_ignore_delimiter=form.get("task_ftp_ignore_delimiter", None, type=int),
-            enable_source_cache=form.get("task_enable_source_cache", None, type=int),
-            source_require_sql_output=form.get("task_require_sql_output", None, type=int),
-            source_ftp_delimiter=form.get("sourceFtpDelimiter", None, type=str),
-            source_ssh_id=form.get("task-source-ssh", None, type=int),
-            source_query_type_id=form.get("sourceQueryType", None, type=int),
-            source_git=form.get("sourceGit", None, type=str),
-            source_devops=form.get("sourceDevops", None, type=str),
-            query_smb_file=form.get("sourceQuerySmbFile", None, type=str),
-            query_smb_id=form.get("task-query-smb", None, type=int),
-            query_sftp_file=form.get("sourceQuerySftpFile", None, type=str),
-            query_sftp_id=form.get("task-query-sftp", None, type=int),
-            query_ftp_file=form.get("sourceQueryFtpFile", None, type=str),
-            query_ftp_id=form.get("task-query-ftp", None, type=int),
-            source_url=form.get("sourceURL", None, type=str),
-            source_code=form.get("sourceCode", None, type=str),
-            processing_type_id=form.get("processingType", None, type=int),
-            processing_smb_file=form.get("processingSmbFile", None, type=str),
-            processing_smb_id=form.get("task-processing-smb", None, type=int),
-            processing_sftp_file=form.get("processingSftpFile", None, type=str),
-            processing_sftp_id=form.get("task-processing-sftp", None, type=int),
-            processing_ftp_file=form.get("processingFtpFile", None, type=str),
-            processing_ftp_id=form.get("task-processing-ftp", None, type=int),
-            processing_git=form.get("processingGit", None, type=str),
-            processing_devops=form.get("processingDevops", None, type=str),
-            processing_url=form.get("processingUrl", None, type=str),
-            processing_code=form.get("processingCode", None, type=str),
-            processing_command=form.get("processingCommand", None, type=str),
-            destination_quote_level_id=form.get("quoteLevel", 3, type=int),
-            destination_file_type_id=form.get("fileType", None, type=int),
-            destination_file_name=form.get(
-                "destinationFileName", form.get("name", "undefined", type=str), type=str
-            ),
-            destination_create_zip=form.get("task_create_zip", None, type=int),
-            destination_zip_name=form.get(
-                "destinationZipName", form.get("name", "undefined", type=str), type=str
-            ),
-            destination_file_delimiter=form.get("fileDelimiter", None, type=str),
-            destination_file_line_terminator=form.get("fileTerminator", None, type=str),
-            destination_ignore_delimiter=form.get("task_ignore_file_delimiter", None, type=int),
-            file_gpg=form.get("task_file_gpg", 0, type=int),
-            file_gpg_id=form.get("task-file-gpg", None, type=int),
-            destination_sftp=form.get("task_save_sftp", 0, type=int),
-            destination_sftp_id=form.get("task-destination-sftp", None, type=int),
-            destination_sftp_overwrite=form.get("task_overwrite_sftp", None, type=int),
-            destination_sftp_dont_send_empty_file=form.get(
-                "task_sftp_dont_send_empty", 0, type=int
-            ),
-            destination_ftp=form.get("task_save_ftp", 0, type=int),
-            destination_ftp_id=form.get("task-destination-ftp", None, type=int),
-            destination_ftp_overwrite=form.get("task_overwrite_ftp", None, type=int),
-            destination_ftp_dont_send_empty_file=form.get("task_ftp_dont_send_empty", 0, type=int),
-            destination_smb=form.get("task_save_smb", 0, type=int),
-            destination_smb_id=form.get("task-destination-smb", None, type=int),
-            destination_smb_overwrite=form.get("task_overwrite_smb", None, type=int),
-            destination_smb_dont_send_empty_file=form.get("task_smb_dont_send_empty", 0, type=int),
-            email_completion=form.get("task_send_completion_email", 0, type=int),
-            email_completion_recipients=form.get("completionEmailRecip", "", type=str),
-            email_completion_message=form.get("completion_email_msg", "", type=str),
-            email_completion_subject=form.get("completionEmailSubject", "", type=str),
-            email_completion_log=form.get("task_send_completion_email_log", 0, type=int),
-            email_completion_file=form.get("task_send_output", 0, type=int),
-            email_completion_dont_send_empty_file=form.get("task_dont_send_empty", 0, type=int),
-            email_completion_file_embed=form.get("task_embed_output", 0, type=int),
-            email_error=form.get("task_send_error_email", 0, type=int),
-            email_error_recipients=form.get("errorEmailRecip", "", type=str),
-            email_error_message=form.get("errorEmailMsg", "", type=str),
-            email_error_subject=form.get("errorEmailSubject", "", type=str),
-            enabled=form.get("task-ooff", 0, type=int),
-        )
-    )
-
-    db.session.commit()
+    Task.query.filter_by(id=task.id).update(fields)
 
     # update params 1. remove old params
     TaskParam.query.filter_by(task_id=task_id).delete()
-    db.session.commit()
 
     # update params 2. add new params
     for param in list(
@@ -468,27 +374,28 @@ def task_edit_post(task_id: int) -> Response:
                 )
             )
 
-    db.session.commit()
-
-    me = me.first()
-
-    log = TaskLog(
-        task_id=task_id,
-        status_id=7,
-        message=(current_user.full_name or "none") + ": Task edited.",
-    )
-    db.session.add(log)
-    db.session.commit()
-
-    if me.enabled == 1:
-        log = TaskLog(
+    db.session.add(
+        TaskLog(
             task_id=task_id,
             status_id=7,
-            message=(current_user.full_name or "none") + ": Task enabled.",
+            message=(current_user.full_name or "none") + ": Task edited.",
+        )
+    )
+
+    if fields["enabled"] == 1:
+        db.session.add(
+            TaskLog(
+                task_id=task_id,
+                status_id=7,
+                message=(current_user.full_name or "none") + ": Task enabled.",
+            )
         )
-        db.session.add(log)
-        db.session.commit()
 
+    # the task, its params and the logs are saved in one transaction before
+    # the executor picks the task up.
+    db.session.commit()
+
+    if fields["enabled"] == 1:
         submit_executor("enable_task", task_id)
 
     else:
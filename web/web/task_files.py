@@ -2,9 +2,8 @@
 
 import json
 import os
-import zipfile
 from dataclasses import dataclass
-from typing import Generator, Optional
+from typing import Optional
 
 import requests
 from flask import Blueprint
@@ -13,9 +12,10 @@ from flask import jsonify, redirect, send_file, url_for
 from flask_login import current_user, login_required
 from werkzeug.wrappers import Response
 
-from runner.model import Task, TaskLog
+from runner.model import TaskLog
 from web import db
 from web.model import TaskFile
+from web.web import http_session
 
 task_files_bp = Blueprint("task_files_bp", __name__)
 
@@ -24,7 +24,7 @@ task_files_bp = Blueprint("task_files_bp", __name__)
 class RunnerLog:
     """Save log messages."""
 
-    task: Task
+    task_id: int
     run_id: Optional[str]
     source_id: int
     message: str
@@ -33,7 +33,7 @@ class RunnerLog:
     def __post_init__(self) -> None:
         """Save message."""
         log = TaskLog(
-            task_id=self.task.id,
+            task_id=self.task_id,
             job_id=self.run_id,
             error=self.error,
             status_id=self.source_id,
@@ -48,10 +48,10 @@ class RunnerLog:
 def filename_preview(task_id: int) -> str:
     """Generate a task filename preview."""
     try:
-        return requests.get(
+        return http_session.get(
             f"{app.config['RUNNER_HOST']}/task/{task_id}/filename_preview", timeout=60
         ).text
-    except BaseException as e:
+    except requests.RequestException as e:
         return f'<span class="has-tooltip-arrow has-tooltip-right has-tooltip-multiline tag is-danger is-light" data-tooltip="{e}">Offline</span>'
 
 
@@ -60,8 +60,8 @@ def filename_preview(task_id: int) -> str:
 def one_task_file_send_sftp(task_id: int, file_id: int) -> Response:
     """Reload task SFTP output."""
     try:
-        my_file = TaskFile.query.filter_by(id=file_id).first()
-        output = requests.get(
+        my_file = db.session.get(TaskFile, file_id)
+        output = http_session.get(
             f"{app.config['RUNNER_HOST']}/send_sftp/{my_file.job_id}/{file_id}",
             timeout=60,
         ).json()
@@ -69,15 +69,15 @@ def one_task_file_send_sftp(task_id: int, file_id: int) -> Response:
             raise ValueError(output.get("error"))
 
         RunnerLog(
-            my_file.task,
+            my_file.task_id,
             my_file.job_id,
             7,
             f"{current_user.full_name} Manually sending file to SFTP server.\n{my_file.name}",
         )
 
-    except BaseException as e:
+    except (requests.RequestException, ValueError) as e:
         RunnerLog(
-            my_file.task,
+            my_file.task_id,
             my_file.job_id,
             7,
             f"{current_user.full_name} Failed to manually sending file to SFTP server.\n{my_file.name}\n{e}",
@@ -92,8 +92,8 @@ def one_task_file_send_sftp(task_id: int, file_id: int) -> Response:
 def one_task_file_send_ftp(task_id: int, file_id: int) -> Response:
     """Reload task FTP output."""
     try:
-        my_file = TaskFile.query.filter_by(id=file_id).first()
-        output = requests.get(
+        my_file = db.session.get(TaskFile, file_id)
+        output = http_session.get(
             f"{app.config['RUNNER_HOST']}/send_ftp/{task_id}/{my_file.job_id}/{file_id}",
             timeout=60,
         ).json()
@@ -101,15 +101,15 @@ def one_task_file_send_ftp(task_id: int, file_id: int) -> Response:
             raise ValueError(output.get("error"))
 
         RunnerLog(
-            my_file.task,
+            my_file.task_id,
             my_file.job_id,
             7,
             f"{current_user.full_name} Manually sending file to FTP server.\n{my_file.name}",
         )
 
-    except BaseException as e:
+    except (requests.RequestException, ValueError) as e:
         RunnerLog(
-            my_file.task,
+            my_file.task_id,
             my_file.job_id,
             7,
             f"{current_user.full_name} Failed to manually sending file to FTP server.\n{my_file.name}\n{e}",
@@ -124,8 +124,8 @@ def one_task_file_send_ftp(task_id: int, file_id: int) -> Response:
 def one_task_file_send_smb(task_id: int, file_id: int) -> Response:
     """Reload task SMB output."""
     try:
-        my_file = TaskFile.query.filter_by(id=file_id).first()
-        output = requests.get(
+        my_file = db.session.get(TaskFile, file_id)
+        output = http_session.get(
             f"{app.config['RUNNER_HOST']}/send_smb/{my_file.job_id}/{file_id}",
             timeout=60,
         ).json()
@@ -133,15 +133,15 @@ def one_task_file_send_smb(task_id: int, file_id: int) -> Response:
             raise ValueError(output.get("error"))
 
         RunnerLog(
-            my_file.task,
+            my_file.task_id,
             my_file.job_id,
             7,
             f"{current_user.full_name} Manually sending file to SMB server.\n{my_file.name}",
         )
 
-    except BaseException as e:
+    except (requests.RequestException, ValueError) as e:
         RunnerLog(
-            my_file.task,
+            my_file.task_id,
             my_file.job_id,
             7,
             f"{current_user.full_name} Failed to manually sending file to SMB server.\n{my_file.name}\n{e}",
@@ -156,8 +156,8 @@ def one_task_file_send_smb(task_id: int, file_id: int) -> Response:
 def one_task_file_send_email(task_id: int, file_id: int) -> Response:
     """Resend task email output."""
     try:
-        my_file = TaskFile.query.filter_by(id=file_id).first()
-        output = requests.get(
+        my_file = db.session.get(TaskFile, file_id)
+        output = http_session.get(
             f"{app.config['RUNNER_HOST']}/send_email/{my_file.job_id}/{file_id}",
             timeout=60,
         ).json()
@@ -165,15 +165,15 @@ def one_task_file_send_email(task_id: int, file_id: int) -> Response:
             raise ValueError(output.get("error"))
 
         RunnerLog(
-            my_file.task,
+            my_file.task_id,
             my_file.job_id,
             7,
             f"{current_user.full_name} Manually sending file to email.\n{my_file.name}",
         )
 
-    except BaseException as e:
+    except (requests.RequestException, ValueError) as e:
         RunnerLog(
-            my_file.task,
+            my_file.task_id,
             my_file.job_id,
             7,
             f"{current_user.full_name} Failed to manually sending file to email.\n{my_file.name}\n{e}",
@@ -187,37 +187,28 @@ def one_task_file_send_email(task_id: int, file_id: int) -> Response:
 @login_required
 def one_task_file_download(file_id: int) -> Response:
     """Download task backup file."""
-    my_file = TaskFile.query.filter_by(id=file_id).first()
+    my_file = db.session.get(TaskFile, file_id)
 
     if my_file:
         RunnerLog(
-            my_file.task,
+            my_file.task_id,
             my_file.job_id,
             7,
             f"{current_user.full_name} Manually downloading file.\n{my_file.name}",
         )
 
         source_file = json.loads(
-            requests.get("%s/file/%s" % (app.config["RUNNER_HOST"], file_id), timeout=60).text,
+            http_session.get(
+                "%s/file/%s" % (app.config["RUNNER_HOST"], file_id), timeout=60
+            ).content,
         ).get("message")
 
-        def stream_and_remove_file() -> Generator:
-            yield from file_handle
-            os.remove(source_file)
-
-        # check if it is a zip
-
-        if zipfile.is_zipfile(source_file):
-            return send_file(source_file, as_attachment=True, download_name=my_file.name)
-
-        # otherwise, stream it.
+        # the open handle keeps the runner's temp copy readable after it is
+        # removed, and lets the server send it straight from the file.
         # pylint: disable=R1732
-        file_handle = open(source_file, "r")  # noqa:SIM115
+        file_handle = open(source_file, "rb")  # noqa:SIM115
+        os.remove(source_file)
 
-        return Response(
-            stream_and_remove_file(),
-            mimetype="text",
-            headers={"Content-disposition": "attachment; filename=" + my_file.name},
-        )
+        return send_file(file_handle, as_attachment=True, download_name=my_file.name)
 
     return jsonify({"error": "no such file."})